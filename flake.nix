@@ -65,7 +65,7 @@ _ago() {
     COMPREPLY=()
     cur="''${COMP_WORDS[COMP_CWORD]}"
     prev="''${COMP_WORDS[COMP_CWORD-1]}"
-    opts="--help --version --check --emit --output --ast --no-color --quiet --verbose"
+    opts="--help --version --check --emit --output --ast --fast --no-color --quiet --verbose"
     
     case "$prev" in
         --emit)
@@ -101,6 +101,7 @@ _ago() {
         '-o[Output path]:path:_files' \
         '--output[Output path]:path:_files' \
         '--ast[Print parsed AST]' \
+        '--fast[Build without optimizations]' \
         '--no-color[Disable colored output]' \
         '-q[Suppress info messages]' \
         '--quiet[Suppress info messages]' \
@@ -120,6 +121,7 @@ complete -c ago -l check -d 'Only run semantic checks'
 complete -c ago -l emit -d 'Emit output type' -xa 'rust bin'
 complete -c ago -s o -l output -d 'Output path' -r
 complete -c ago -l ast -d 'Print parsed AST'
+complete -c ago -l fast -d 'Build without optimizations'
 complete -c ago -l no-color -d 'Disable colored output'
 complete -c ago -s q -l quiet -d 'Suppress info messages'
 complete -c ago -l verbose -d 'Show verbose output'
@@ -152,6 +154,9 @@ Output path for \-\-emit=bin (default: ./program).
 .B \-\-ast
 Print the parsed AST in JSON format (for debugging).
 .TP
+.B \-\-fast
+Build without Rust optimizations for a faster compile.
+.TP
 .B \-\-no\-color
 Disable colored terminal output.
 .TP
@@ -8,6 +8,7 @@ Usage:
     ago <file.ago> --emit=rust  Output generated Rust code to stdout
     ago <file.ago> --emit=bin   Compile to binary (output to ./program or -o path)
     ago <file.ago> --ast        Print the parsed AST (for debugging)
+    ago <file.ago> --fast       Build without optimizations (faster compile)
 """
 
 import argparse
@@ -132,6 +133,7 @@ def print_help():
   {Y}--emit{E} {G}TYPE{E}            Emit 'rust' source or 'bin' binary
   {Y}-o{E}, {Y}--output{E} {G}PATH{E}      Output path for binary (default: ./program)
   {Y}--ast{E}                  Print the parsed AST
+  {Y}--fast{E}                 Skip Rust optimizations for a faster build
   {Y}--no-color{E}             Disable colored output
   {Y}-q{E}, {Y}--quiet{E}            Suppress info messages
   {Y}--verbose{E}              Show verbose output
@@ -174,6 +176,7 @@ def parse_args():
     parser.add_argument("--emit", choices=["rust", "bin"], metavar="TYPE")
     parser.add_argument("-o", "--output", metavar="PATH")
     parser.add_argument("--ast", action="store_true")
+    parser.add_argument("--fast", action="store_true")
     parser.add_argument("--no-color", action="store_true")
     parser.add_argument("--quiet", "-q", action="store_true")
     parser.add_argument("--verbose", action="store_true")
@@ -246,13 +249,29 @@ edition = "2021"
 
 [dependencies]
 ago_stdlib = {{ path = "{stdlib_path}" }}
+
+[profile.dev]
+debug = false
 ''')
 
 
+def build_profile_dir(release: bool = True) -> Path:
+    """Get the cargo target directory for the chosen build profile."""
+    return OUTPUT_DIR / "target" / ("release" if release else "debug")
+
+
 def compile_rust(
-    rust_code: str, output_path: Path, quiet: bool = False, verbose: bool = False
+    rust_code: str,
+    output_path: Path,
+    quiet: bool = False,
+    verbose: bool = False,
+    release: bool = True,
 ) -> Path:
-    """Compile Rust code to binary."""
+    """Compile Rust code to binary.
+
+    With release=False the dev profile is used: no LLVM optimizations and no
+    debug info, which builds small programs much faster.
+    """
     # Set up build directory
     setup_build_dir()
 
@@ -268,8 +287,12 @@ def compile_rust(
     if not quiet:
         print_info("compiling...")
 
+    cargo_cmd = ["cargo", "build"]
+    if release:
+        cargo_cmd.append("--release")
+
     result = subprocess.run(
-        ["cargo", "build", "--release"],
+        cargo_cmd,
         cwd=OUTPUT_DIR,
         capture_output=True,
         text=True,
@@ -290,7 +313,7 @@ def compile_rust(
         sys.exit(1)
 
     # Copy/link to output path
-    exe_path = OUTPUT_DIR / "target" / "release" / "ago_program"
+    exe_path = build_profile_dir(release) / "ago_program"
 
     if output_path != exe_path:
         import shutil
@@ -358,7 +381,9 @@ def main():
     # Handle --emit=bin
     if args.emit == "bin":
         output_path = Path(args.output) if args.output else Path("program")
-        exe_path = compile_rust(rust_code, output_path, args.quiet, args.verbose)
+        exe_path = compile_rust(
+            rust_code, output_path, args.quiet, args.verbose, not args.fast
+        )
         print_success(f"compiled to {exe_path}")
         sys.exit(0)
 
@@ -366,9 +391,10 @@ def main():
     with tempfile.TemporaryDirectory():
         exe_path = compile_rust(
             rust_code,
-            OUTPUT_DIR / "target" / "release" / "ago_program",
+            build_profile_dir(not args.fast) / "ago_program",
             args.quiet,
             args.verbose,
+            not args.fast,
         )
 
         if not args.quiet:
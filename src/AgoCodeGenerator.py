@@ -7,6 +7,8 @@ equivalent Rust code using the ago_stdlib runtime library.
 
 from typing import Any, Optional
 
+from src.AgoSemanticChecker import PRELUDE_NATIVES, is_ast_node
+
 
 def to_dict(node: Any) -> dict:
     """Convert an AST node to a dict for easier access."""
@@ -74,6 +76,7 @@ STDLIB_FUNCTIONS = {
     "inseri",
     "removium",
     "into_iter",
+    *PRELUDE_NATIVES,
 }
 
 # Stdlib functions that mutate their first argument (need &mut)
@@ -92,6 +95,57 @@ def get_suffix_and_stem(name: str) -> tuple[Optional[str], Optional[str]]:
     return None, None
 
 
+# Range of the i128 backing AgoType::Int
+INT_MIN = -(2**127)
+INT_MAX = 2**127 - 1
+
+
+def fold_int_op(op: str, left: int, right: int) -> Optional[int]:
+    """
+    Apply an integer operator the way the Rust stdlib does at runtime.
+    Returns None when the result is not a plain i128 (overflow, division by
+    zero, or an operator that doesn't produce an int), so the operation is
+    left for the runtime.
+    """
+    if op == "+":
+        result = left + right
+    elif op == "-":
+        result = left - right
+    elif op == "*":
+        result = left * right
+    elif op in ("/", "%"):
+        if right == 0:
+            return None
+        # Rust integer division truncates toward zero
+        quotient = abs(left) // abs(right)
+        if (left < 0) != (right < 0):
+            quotient = -quotient
+        if not INT_MIN <= quotient <= INT_MAX:
+            return None
+        result = quotient if op == "/" else left - right * quotient
+    elif op == "&":
+        result = left & right
+    elif op == "|":
+        result = left | right
+    elif op == "^":
+        result = left ^ right
+    else:
+        return None
+    if not INT_MIN <= result <= INT_MAX:
+        return None
+    return result
+
+
+# Return suffixes of memoizable functions: scalars, which are cheap to clone
+# out of the memo table
+MEMO_RETURN_SUFFIXES = {"a", "ae", "am", "es"}
+
+
+# Range operators; ".." includes its end, ".<" does not
+RANGE_OPS = {"..", ".<"}
+
+
+
 # Mapping from Ago type suffixes to Rust TargetType enum
 ENDING_TO_RUST_TARGET = {
     "a": "Int",
@@ -126,11 +180,15 @@ class AgoCodeGenerator:
         self.functions: list[str] = []
         # Track user-defined function names for stem-based resolution
         self.user_functions: set[str] = set()
+        # Stdlib functions not shadowed by a user function of the same name
+        self.stdlib_functions: set[str] = set(STDLIB_FUNCTIONS)
         # Track generated lambdas
         self.lambdas: list[str] = []
         self.lambda_counter = 0
         # Counter for temp variables
         self.temp_counter = 0
+        # Loop iterators in scope (need cloning when passed to lambdas)
+        self._loop_iterators: set[str] = set()
 
     def _optimize_cast_chain(self, result: str, new_target: str) -> str:
         """
@@ -311,17 +369,22 @@ class AgoCodeGenerator:
         """Emit a line of code."""
         self.output_lines.append(f"{self.indent()}{line}")
 
+    def _emit_expr_statement(self, expr: str) -> None:
+        """Emit an expression evaluated only for its side effects."""
+        self.emit(f"{expr};")
+
     def emit_raw(self, line: str) -> None:
         """Emit a line without indentation."""
         self.output_lines.append(line)
 
     def generate(self, ast: Any) -> str:
         """Generate Rust code from the AST and return as string."""
-        # Emit prelude
-        self._emit_prelude()
-
         # First pass: collect user function NAMES (needed for stem resolution in lambdas)
         self._collect_function_names(ast)
+        self.stdlib_functions = STDLIB_FUNCTIONS - self.user_functions
+
+        # Emit prelude
+        self._emit_prelude()
 
         # Note: Lambdas are now generated inline as closures (not as top-level functions)
         # This allows them to capture variables from their surrounding scope
@@ -358,7 +421,7 @@ class AgoCodeGenerator:
             for item in ast:
                 self._collect_lambdas(item, seen)
             return
-        if isinstance(ast, dict) or hasattr(ast, "parseinfo"):
+        if is_ast_node(ast):
             d = to_dict(ast)
             # Check if this is a lambda (has body but no name)
             # Exclude loops (while has 'cond', for has 'iterator'/'iterable')
@@ -503,7 +566,7 @@ class AgoCodeGenerator:
         if "implicit_return" in d:
             # This is an expression statement - just evaluate it (not return, since it's not last)
             expr = self._generate_expr(d["implicit_return"])
-            self.emit(f"{expr};")
+            self._emit_expr_statement(expr)
             return
         
         # Otherwise, generate as normal statement (declarations, control flow, etc.)
@@ -614,12 +677,20 @@ class AgoCodeGenerator:
         self.emit_raw("    and, or, not, bitwise_and, bitwise_or, bitwise_xor,")
         self.emit_raw("    slice, sliceto, contains, elvis,")
         self.emit_raw("    unary_minus, unary_plus,")
-        self.emit_raw("    get, set, inseri, removium, validate_list_type, into_iter,")
+        self.emit_raw("    get, set, inseri, removium, validate_list_type, into_iter, range_iter,")
+        # A program may define its own versions of these
+        natives = [f for f in PRELUDE_NATIVES if f in self.stdlib_functions]
+        if natives:
+            self.emit_raw(f"    {', '.join(natives)},")
         self.emit_raw("    dici, apertu, species, exei, aequalam, scribi, audies")
         self.emit_raw("};")
         self.emit_raw("use std::collections::HashMap;")
         self.emit_raw("use std::rc::Rc;")
 
+    def _stem_targets(self) -> list[str]:
+        """Functions a stem-cast call such as mina() may resolve to."""
+        return [*self.user_functions, *(f for f in PRELUDE_NATIVES if f in self.stdlib_functions)]
+
     def _collect_function_names(self, ast: Any) -> None:
         """Pre-pass: collect all user function names for stem resolution."""
         if ast is None:
@@ -692,7 +763,7 @@ class AgoCodeGenerator:
                 expr = self._generate_expr(call_d["expr"])
             else:
                 expr = self._generate_expr(d["call"])
-            self.emit(f"{expr};")
+            self._emit_expr_statement(expr)
             return
         # Process as statement
         self._generate_statement(item)
@@ -786,7 +857,7 @@ class AgoCodeGenerator:
             # - {call: {expr: {base: {id: "param"}, ops: [{call: {func: "inseri"}}]}}}
             
             call_node = d.get("call") or d
-            if isinstance(call_node, dict) or hasattr(call_node, "parseinfo"):
+            if is_ast_node(call_node):
                 call_d = to_dict(call_node)
                 
                 # Old pattern support
@@ -838,7 +909,7 @@ class AgoCodeGenerator:
                 if self._function_returns_lambda(item):
                     return True
             return False
-        if isinstance(body, dict) or hasattr(body, "parseinfo"):
+        if is_ast_node(body):
             d = to_dict(body)
             # Check if this is a return statement with a lambda
             if d.get("value") is not None:
@@ -918,9 +989,15 @@ class AgoCodeGenerator:
         returns_lambda = self._function_returns_lambda(body)
         return_type = "AgoLambda" if returns_lambda else "AgoType"
 
+        # Pure recursions over ints get a memo table in front of the body
+        rust_name = func_name
+        if not returns_lambda and self._is_memoizable(func_name, params, body):
+            rust_name = f"__{func_name}_uncached"
+            self._emit_memo_wrapper(func_name, params, rust_name)
+
         # Emit function signature
         self.emit_raw("")
-        self.emit_raw(f"fn {func_name}({param_str}) -> {return_type} {{")
+        self.emit_raw(f"fn {rust_name}({param_str}) -> {return_type} {{")
         self.indent_level += 1
 
         # Clone parameters at function start if they're mutated
@@ -964,6 +1041,89 @@ class AgoCodeGenerator:
         self._ref_params = old_ref_params
         self._current_func_returns_lambda = old_returns_lambda
 
+    def _is_memoizable(self, func_name: str, params: list[str], body: Any) -> bool:
+        """
+        Check whether a function's result depends only on its arguments: it
+        takes only ints, returns a scalar, recurses on itself and calls
+        nothing else (no I/O, no other functions, no lambdas).
+        """
+        if not params:
+            return False
+        if any(get_suffix_and_stem(p)[0] != "a" for p in params):
+            return False
+        suffix, stem = get_suffix_and_stem(func_name)
+        if suffix not in MEMO_RETURN_SUFFIXES:
+            return False
+
+        recursive = False
+
+        def is_self_call(name: str) -> bool:
+            if name == func_name:
+                return True
+            # Stem-based call with a cast, e.g. facta calling factes()
+            if name in self.user_functions or name in self.stdlib_functions:
+                return False
+            return get_suffix_and_stem(name)[1] == stem
+
+        def visit(node: Any) -> bool:
+            nonlocal recursive
+            if node is None or isinstance(node, str):
+                return True
+            if isinstance(node, (list, tuple)):
+                return all(visit(item) for item in node)
+
+            d = to_dict(node)
+            # Lambdas may capture and call anything
+            if "params" in d and "body" in d:
+                return False
+            func = d.get("func")
+            if func is not None:
+                if not is_self_call(str(func)):
+                    return False
+                recursive = True
+            return all(
+                visit(val) for key, val in d.items() if key != "parseinfo"
+            )
+
+        return visit(body) and recursive
+
+    def _emit_memo_wrapper(self, func_name: str, params: list[str], uncached: str) -> None:
+        """Emit a caching front for a memoizable function, keyed on its int
+        arguments."""
+        args = ", ".join(params)
+        param_str = ", ".join(f"{p}: &AgoType" for p in params)
+        if len(params) == 1:
+            key_type, scrutinee, pattern, key = "i128", params[0], "AgoType::Int(k0)", "*k0"
+        else:
+            key_type = f"({', '.join('i128' for _ in params)})"
+            scrutinee = f"({args})"
+            pattern = f"({', '.join(f'AgoType::Int(k{i})' for i in range(len(params)))})"
+            key = f"({', '.join(f'*k{i}' for i in range(len(params)))})"
+
+        self.emit_raw("")
+        self.emit_raw(f"fn {func_name}({param_str}) -> AgoType {{")
+        self.indent_level += 1
+        self.emit("thread_local! {")
+        self.emit(
+            f"    static MEMO: std::cell::RefCell<HashMap<{key_type}, AgoType>> ="
+            " std::cell::RefCell::new(HashMap::new());"
+        )
+        self.emit("}")
+        self.emit(f"let key = match {scrutinee} {{")
+        self.emit(f"    {pattern} => {key},")
+        self.emit(f"    _ => return {uncached}({args}),")
+        self.emit("};")
+        self.emit(
+            "if let Some(hit) = MEMO.with(|memo| memo.borrow().get(&key).cloned()) {"
+        )
+        self.emit("    return hit;")
+        self.emit("}")
+        self.emit(f"let result = {uncached}({args});")
+        self.emit("MEMO.with(|memo| memo.borrow_mut().insert(key, result.clone()));")
+        self.emit("result")
+        self.indent_level -= 1
+        self.emit_raw("}")
+
     def _parse_params(self, params_node: Any) -> list[str]:
         """Parse parameter list into variable names."""
         if params_node is None:
@@ -1001,12 +1161,12 @@ class AgoCodeGenerator:
             return str(d["id"])
         if "value" in d:
             inner = d["value"]
-            if isinstance(inner, dict) or hasattr(inner, "parseinfo"):
+            if is_ast_node(inner):
                 return self._extract_identifier(inner)
         # Handle new postfix structure: base contains the identifier
         if "base" in d:
             base = d["base"]
-            if isinstance(base, dict) or hasattr(base, "parseinfo"):
+            if is_ast_node(base):
                 return self._extract_identifier(base)
         return None
 
@@ -1092,7 +1252,7 @@ class AgoCodeGenerator:
                 expr = self._generate_expr(call_d["expr"])
             else:
                 expr = self._generate_expr(d["call"])
-            self.emit(f"{expr};")
+            self._emit_expr_statement(expr)
         # Check for nested return
         elif "value" in d:
             inner = d["value"]
@@ -1258,10 +1418,10 @@ class AgoCodeGenerator:
                         if item == "aluid":
                             continue
                         if elif_cond is None and item is not None:
-                            if isinstance(item, dict) or hasattr(item, "parseinfo"):
+                            if is_ast_node(item):
                                 elif_cond = item
                         elif elif_body is None and item is not None:
-                            if isinstance(item, dict) or hasattr(item, "parseinfo"):
+                            if is_ast_node(item):
                                 elif_body = item
 
                 if elif_cond:
@@ -1304,7 +1464,14 @@ class AgoCodeGenerator:
 
         iterator = self._extract_identifier(d.get("iterator"))
         iterable = d.get("iterable")
-        iterable_expr = self._generate_expr(iterable)
+        # A literal list that is only iterated can use an unboxed vector
+        literal = self._as_list_literal(iterable)
+        if literal is not None:
+            iterable_expr = f"into_iter(&{self._generate_list(literal, unboxed=True)})"
+        else:
+            iterable_expr = self._generate_range_iter(iterable) or (
+                f"into_iter(&{self._generate_expr(iterable)})"
+            )
 
         # In Ago, only one variable per stem can exist at a time.
         # Save and remove variables with the same stem as the iterator.
@@ -1317,13 +1484,11 @@ class AgoCodeGenerator:
                     shadowed_vars.append(existing_var)
                     self.declared_vars.discard(existing_var)
 
-        self.emit(f"for {iterator} in into_iter(&{iterable_expr}) {{")
+        self.emit(f"for {iterator} in {iterable_expr} {{")
         self.indent_level += 1
         self.declared_vars.add(iterator)
         
         # Track this as a loop iterator (needs cloning when passed to lambdas)
-        if not hasattr(self, "_loop_iterators"):
-            self._loop_iterators = set()
         self._loop_iterators.add(iterator)
         
         self._process_block(d.get("body"))
@@ -1510,6 +1675,11 @@ class AgoCodeGenerator:
             # If left is true, return true without evaluating right
             return f"(if matches!(({left}).as_type(TargetType::Bool), AgoType::Bool(true)) {{ AgoType::Bool(true) }} else {{ {right} }})"
 
+        # Integer arithmetic on literals is folded to a single literal
+        folded = self._const_int(d)
+        if folded is not None:
+            return f"AgoType::Int({folded})"
+
         left = self._generate_expr(d.get("left"))
         right = self._generate_expr(d.get("right"))
 
@@ -1556,6 +1726,10 @@ class AgoCodeGenerator:
     def _generate_unary_op(self, d: dict) -> str:
         """Generate unary operation."""
         op = d.get("op")
+        folded = self._const_int(d)
+        if folded is not None:
+            return f"AgoType::Int({folded})"
+
         right = self._generate_expr(d.get("right"))
         right_ref = self._make_ref(right)
 
@@ -1568,6 +1742,48 @@ class AgoCodeGenerator:
 
         return f"/* unknown unary op {op} */ {right}"
 
+    def _const_int(self, node: Any) -> Optional[int]:
+        """Evaluate an expression made only of integer literals and integer
+        operators, or return None if it isn't one."""
+        if not is_ast_node(node):
+            return None
+        d = to_dict(node)
+
+        if d.get("value") is not None:
+            return self._const_int(d["value"])
+        if d.get("base") is not None:
+            return None if d.get("ops") else self._const_int(d["base"])
+        if d.get("int") is not None:
+            value = int(d["int"])
+            return value if value <= INT_MAX else None
+        if d.get("roman") is not None:
+            return self._roman_to_int(d["roman"])
+        if d.get("paren") is not None:
+            if d.get("expr") is not None:
+                return self._const_int(d["expr"])
+            paren = d["paren"]
+            if isinstance(paren, (list, tuple)) and len(paren) >= 2:
+                return self._const_int(paren[1])
+            return self._const_int(paren)
+
+        op = d.get("op")
+        if op is None or d.get("right") is None:
+            return None
+        right = self._const_int(d["right"])
+        if right is None:
+            return None
+        if d.get("left") is None:
+            # Unary operators
+            if op == "+":
+                return right
+            if op == "-" and right != INT_MIN:
+                return -right
+            return None
+        left = self._const_int(d["left"])
+        if left is None:
+            return None
+        return fold_int_op(op, left, right)
+
     def _generate_call(self, call_node: Any) -> str:
         """Generate function call or method chain."""
         d = to_dict(call_node)
@@ -1617,7 +1833,7 @@ class AgoCodeGenerator:
                     if (
                         not args
                         and func_name in ENDING_TO_TARGET_TYPE
-                        and func_name not in STDLIB_FUNCTIONS
+                        and func_name not in self.stdlib_functions
                         and func_name not in self.user_functions
                         and recv_expr is not None
                     ):
@@ -1632,10 +1848,10 @@ class AgoCodeGenerator:
                         # Check for stem-based function call (e.g., mina() -> minium())
                         actual_func = func_name
                         cast_suffix = None
-                        if func_name not in self.user_functions and func_name not in STDLIB_FUNCTIONS:
+                        if func_name not in self.user_functions and func_name not in self.stdlib_functions:
                             suffix, stem = get_suffix_and_stem(func_name)
                             if stem and suffix:
-                                for uf in self.user_functions:
+                                for uf in self._stem_targets():
                                     uf_suffix, uf_stem = get_suffix_and_stem(uf)
                                     if uf_stem == stem:
                                         actual_func = uf
@@ -1643,7 +1859,7 @@ class AgoCodeGenerator:
                                         break
                         
                         # Add references for stdlib functions
-                        if actual_func in STDLIB_FUNCTIONS:
+                        if actual_func in self.stdlib_functions:
                             ref_args = []
                             for i, arg in enumerate(args):
                                 if actual_func in MUTATING_STDLIB_FUNCTIONS and i == 0:
@@ -1679,7 +1895,7 @@ class AgoCodeGenerator:
                     for sub in item:
                         if sub == "." or sub is None:
                             continue
-                        if isinstance(sub, dict) or hasattr(sub, "parseinfo"):
+                        if is_ast_node(sub):
                             sub_d = to_dict(sub)
                             # Handle new chain_elem structure: {call: {...}} or {field: ...}
                             if sub_d.get("call"):
@@ -1699,7 +1915,7 @@ class AgoCodeGenerator:
                                 # BUT only if it's not a known stdlib or user function
                                 if (
                                     not args
-                                    and func_name_str not in STDLIB_FUNCTIONS
+                                    and func_name_str not in self.stdlib_functions
                                     and func_name_str not in self.user_functions
                                 ):
                                     # First check if the name IS a type suffix (e.g., .a(), .es())
@@ -1717,7 +1933,7 @@ class AgoCodeGenerator:
                                     if suffix and suffix in ENDING_TO_TARGET_TYPE:
                                         # Check if there's a user function with this stem
                                         found_func = None
-                                        for uf in self.user_functions:
+                                        for uf in self._stem_targets():
                                             uf_suffix, uf_stem = get_suffix_and_stem(uf)
                                             if uf_stem == stem:
                                                 found_func = uf
@@ -1734,11 +1950,11 @@ class AgoCodeGenerator:
                                 cast_target = None
                                 if (
                                     func_name_str not in self.user_functions
-                                    and func_name_str not in STDLIB_FUNCTIONS
+                                    and func_name_str not in self.stdlib_functions
                                 ):
                                     call_suffix, call_stem = get_suffix_and_stem(func_name_str)
                                     if call_stem and call_suffix:
-                                        for uf in self.user_functions:
+                                        for uf in self._stem_targets():
                                             uf_suffix, uf_stem = get_suffix_and_stem(uf)
                                             if uf_stem == call_stem and uf != func_name_str:
                                                 actual_func_name = uf
@@ -1772,7 +1988,7 @@ class AgoCodeGenerator:
                                     
                                     receiver = f"&mut {actual_var}"
                                     all_args = [receiver] + ref_args
-                                elif actual_func_name in STDLIB_FUNCTIONS:
+                                elif actual_func_name in self.stdlib_functions:
                                     # Stdlib functions take &AgoType references
                                     receiver = (
                                         f"&{result}"
@@ -1802,7 +2018,7 @@ class AgoCodeGenerator:
                         # BUT only if it's not a known stdlib or user function
                         if (
                             not args
-                            and func_name_str not in STDLIB_FUNCTIONS
+                            and func_name_str not in self.stdlib_functions
                             and func_name_str not in self.user_functions
                         ):
                             # First check if the name IS a type suffix (e.g., .a(), .es())
@@ -1818,7 +2034,7 @@ class AgoCodeGenerator:
                             if suffix and suffix in ENDING_TO_TARGET_TYPE:
                                 # Check if there's a user function with this stem
                                 found_func = None
-                                for uf in self.user_functions:
+                                for uf in self._stem_targets():
                                     uf_suffix, uf_stem = get_suffix_and_stem(uf)
                                     if uf_stem == stem:
                                         found_func = uf
@@ -1835,11 +2051,11 @@ class AgoCodeGenerator:
                         cast_target = None
                         if (
                             func_name_str not in self.user_functions
-                            and func_name_str not in STDLIB_FUNCTIONS
+                            and func_name_str not in self.stdlib_functions
                         ):
                             call_suffix, call_stem = get_suffix_and_stem(func_name_str)
                             if call_stem and call_suffix:
-                                for uf in self.user_functions:
+                                for uf in self._stem_targets():
                                     uf_suffix, uf_stem = get_suffix_and_stem(uf)
                                     if uf_stem == call_stem and uf != func_name_str:
                                         actual_func_name = uf
@@ -1873,7 +2089,7 @@ class AgoCodeGenerator:
                             
                             receiver = f"&mut {actual_var}"
                             all_args = [receiver] + ref_args
-                        elif actual_func_name in STDLIB_FUNCTIONS:
+                        elif actual_func_name in self.stdlib_functions:
                             # Stdlib functions take &AgoType references
                             receiver = (
                                 f"&{result}" if not result.startswith("&") else result
@@ -1898,6 +2114,7 @@ class AgoCodeGenerator:
         # Simple function call
         func_name = None
         args = []
+        args_node = None
 
         if first:
             first_d = to_dict(first) if not isinstance(first, str) else {}
@@ -1921,6 +2138,16 @@ class AgoCodeGenerator:
                 args = self._parse_args(args_node)
 
         if func_name:
+            # dici("...") or "...".dici()
+            if recv is not None:
+                literal_arg = None if args else recv
+            else:
+                args_d = to_dict(args_node) if args_node else {}
+                literal_arg = None if args_d.get("rest") else args_d.get("first")
+            printed = self._print_literal(func_name, literal_arg)
+            if printed is not None:
+                return printed
+
             # If there's a receiver (method chain), it becomes the first argument
             if recv is not None:
                 recv_expr = self._generate_expr(recv)
@@ -1930,7 +2157,7 @@ class AgoCodeGenerator:
                 if (
                     not args  # no additional args
                     and func_name in ENDING_TO_TARGET_TYPE
-                    and func_name not in STDLIB_FUNCTIONS
+                    and func_name not in self.stdlib_functions
                     and func_name not in self.user_functions
                 ):
                     target_type = ENDING_TO_TARGET_TYPE[func_name]
@@ -1942,7 +2169,7 @@ class AgoCodeGenerator:
             if func_name in self.declared_vars:
                 # Lambda call - pass args as slice
                 # Clone args that are loop iterators (they'd be moved into the array otherwise)
-                loop_iters = getattr(self, "_loop_iterators", set())
+                loop_iters = self._loop_iterators
                 cloned_args = []
                 for arg in args:
                     if arg in loop_iters:
@@ -1959,12 +2186,12 @@ class AgoCodeGenerator:
             # If function doesn't exist directly, try to find by stem
             if (
                 func_name not in self.user_functions
-                and func_name not in STDLIB_FUNCTIONS
+                and func_name not in self.stdlib_functions
             ):
                 call_suffix, call_stem = get_suffix_and_stem(func_name)
                 if call_stem and call_suffix:
                     # Look for user-defined function with the same stem
-                    for uf in self.user_functions:
+                    for uf in self._stem_targets():
                         uf_suffix, uf_stem = get_suffix_and_stem(uf)
                         if uf_stem == call_stem and uf != func_name:
                             # Found a function with the same stem
@@ -1975,7 +2202,7 @@ class AgoCodeGenerator:
 
             # Only add references for stdlib functions (they take &AgoType)
             # User-defined functions take AgoType by value
-            if actual_func_name in STDLIB_FUNCTIONS:
+            if actual_func_name in self.stdlib_functions:
                 ref_args = []
                 for i, arg in enumerate(args):
                     # For mutating functions, first arg needs &mut
@@ -2007,6 +2234,29 @@ class AgoCodeGenerator:
 
         return "AgoType::Null"
 
+    def _print_literal(self, func_name: str, arg: Any) -> Optional[str]:
+        """
+        Generate a stdlib dici of a string literal as a println! of the
+        literal, skipping the AgoType::String it would otherwise allocate.
+        Returns None for any other call.
+        """
+        if func_name != "dici" or "dici" not in self.stdlib_functions:
+            return None
+        while is_ast_node(arg):
+            d = to_dict(arg)
+            if d.get("str") is not None:
+                # Evaluates to Null, like the stdlib dici
+                return f'{{ println!("{{}}", {d["str"]}); AgoType::Null }}'
+            if d.get("value") is not None:
+                arg = d["value"]
+            elif d.get("paren") is not None:
+                arg = d.get("expr")
+            elif d.get("base") is not None and not d.get("ops"):
+                arg = d["base"]
+            else:
+                return None
+        return None
+
     def _parse_args(self, args_node: Any) -> list[str]:
         """Parse argument list."""
         d = to_dict(args_node)
@@ -2102,7 +2352,7 @@ class AgoCodeGenerator:
         if not isinstance(ops, (list, tuple)):
             ops = [ops] if ops else []
         
-        for op in ops:
+        for i, op in enumerate(ops):
             if op is None:
                 continue
             
@@ -2134,7 +2384,7 @@ class AgoCodeGenerator:
                     if isinstance(meth_info, (list, tuple)):
                         for item in meth_info:
                             if item != "." and item is not None:
-                                if isinstance(item, dict) or hasattr(item, "parseinfo"):
+                                if is_ast_node(item):
                                     call_d = to_dict(item)
                                     break
                     else:
@@ -2150,8 +2400,15 @@ class AgoCodeGenerator:
                         args_node = call_d.get("args")
                         if args_node:
                             args = self._parse_args(args_node)
-                        
-                        result = self._apply_method_call(result, func_name_str, args, base_var_name)
+
+                        # "...".dici() directly on the literal base
+                        printed = None
+                        if i == 0 and not args:
+                            printed = self._print_literal(func_name_str, base)
+                        if printed is not None:
+                            result = printed
+                        else:
+                            result = self._apply_method_call(result, func_name_str, args, base_var_name)
             
             # Handle field access: field:(PERIOD name:identifier) or strfield:(PERIOD name:STR_LIT)
             # Grammar creates both 'name' and 'field'/'strfield' keys at the same level
@@ -2175,7 +2432,7 @@ class AgoCodeGenerator:
         # Check if this is a type cast (no args, name is a type suffix)
         if (
             not args
-            and func_name not in STDLIB_FUNCTIONS
+            and func_name not in self.stdlib_functions
             and func_name not in self.user_functions
         ):
             # Check if name IS a type suffix
@@ -2187,7 +2444,7 @@ class AgoCodeGenerator:
             suffix, stem = get_suffix_and_stem(func_name)
             if suffix and stem:
                 # Look for a user function with the same stem
-                for uf in self.user_functions:
+                for uf in self._stem_targets():
                     uf_suffix, uf_stem = get_suffix_and_stem(uf)
                     if uf_stem == stem and uf != func_name:
                         # Call the function with receiver as first arg, then cast result
@@ -2203,11 +2460,11 @@ class AgoCodeGenerator:
         cast_target = None
         if (
             func_name not in self.user_functions
-            and func_name not in STDLIB_FUNCTIONS
+            and func_name not in self.stdlib_functions
         ):
             call_suffix, call_stem = get_suffix_and_stem(func_name)
             if call_stem and call_suffix:
-                for uf in self.user_functions:
+                for uf in self._stem_targets():
                     uf_suffix, uf_stem = get_suffix_and_stem(uf)
                     if uf_stem == call_stem and uf != func_name:
                         actual_func_name = uf
@@ -2242,7 +2499,7 @@ class AgoCodeGenerator:
             
             receiver = f"&mut {actual_var}"
             all_args = [receiver] + ref_args
-        elif actual_func_name in STDLIB_FUNCTIONS:
+        elif actual_func_name in self.stdlib_functions:
             receiver = f"&{receiver_expr}" if not receiver_expr.startswith("&") else receiver_expr
             ref_args = [f"&{arg}" if not arg.startswith("&") else arg for arg in args]
             all_args = [receiver] + ref_args
@@ -2288,7 +2545,7 @@ class AgoCodeGenerator:
                 if isinstance(item, (list, tuple)):
                     for sub in item:
                         if sub != "." and sub is not None:
-                            if isinstance(sub, dict) or hasattr(sub, "parseinfo"):
+                            if is_ast_node(sub):
                                 method = sub
                                 break
                 else:
@@ -2316,7 +2573,7 @@ class AgoCodeGenerator:
                         # BUT only if it's not a known stdlib or user function
                         if (
                             not args
-                            and func_name_str not in STDLIB_FUNCTIONS
+                            and func_name_str not in self.stdlib_functions
                             and func_name_str not in self.user_functions
                         ):
                             # First check if the name IS a type suffix (e.g., .a(), .es())
@@ -2331,7 +2588,7 @@ class AgoCodeGenerator:
                             if suffix and stem:
                                 # Look for a user function with the same stem
                                 found_func = None
-                                for uf in self.user_functions:
+                                for uf in self._stem_targets():
                                     uf_suffix, uf_stem = get_suffix_and_stem(uf)
                                     if uf_stem == stem and uf != func_name_str:
                                         found_func = uf
@@ -2359,11 +2616,11 @@ class AgoCodeGenerator:
                         cast_target = None
                         if (
                             func_name_str not in self.user_functions
-                            and func_name_str not in STDLIB_FUNCTIONS
+                            and func_name_str not in self.stdlib_functions
                         ):
                             call_suffix, call_stem = get_suffix_and_stem(func_name_str)
                             if call_stem and call_suffix:
-                                for uf in self.user_functions:
+                                for uf in self._stem_targets():
                                     uf_suffix, uf_stem = get_suffix_and_stem(uf)
                                     if uf_stem == call_stem and uf != func_name_str:
                                         actual_func_name = uf
@@ -2402,7 +2659,7 @@ class AgoCodeGenerator:
                             
                             receiver = f"&mut {actual_var}"
                             all_args = [receiver] + ref_args
-                        elif actual_func_name in STDLIB_FUNCTIONS:
+                        elif actual_func_name in self.stdlib_functions:
                             # Stdlib functions take &AgoType references
                             receiver = (
                                 f"&{result}" if not result.startswith("&") else result
@@ -2491,9 +2748,62 @@ class AgoCodeGenerator:
 
         return result
 
-    def _generate_list(self, list_node: Any) -> str:
-        """Generate list literal."""
+    def _generate_range_iter(self, node: Any) -> Optional[str]:
+        """
+        Generate a direct iterator over a range literal (a..b or a.<b), or
+        return None if the expression is not one.
+        """
+        while is_ast_node(node):
+            d = to_dict(node)
+            if d.get("op") in RANGE_OPS and d.get("left") is not None:
+                left = self._make_ref(self._generate_expr(d["left"]))
+                right = self._make_ref(self._generate_expr(d.get("right")))
+                inclusive = "true" if d["op"] == ".." else "false"
+                return f"range_iter({left}, {right}, {inclusive})"
+            if d.get("ops"):
+                return None
+            if d.get("value") is not None:
+                node = d["value"]
+            elif d.get("base") is not None:
+                node = d["base"]
+            elif d.get("paren") is not None:
+                node = d.get("expr") if d.get("expr") is not None else d["paren"]
+            else:
+                return None
+        if isinstance(node, (list, tuple)) and len(node) == 3 and node[0] == "(":
+            return self._generate_range_iter(node[1])
+        return None
+
+    def _as_list_literal(self, node: Any) -> Optional[list]:
+        """Return the list literal an expression consists of, if it is one."""
+        while is_ast_node(node):
+            d = to_dict(node)
+            if d.get("ops"):
+                return None
+            if d.get("value") is not None:
+                node = d["value"]
+            elif d.get("base") is not None:
+                node = d["base"]
+            elif d.get("list") is not None:
+                node = d["list"]
+            else:
+                return None
+        if isinstance(node, (list, tuple)) and len(node) >= 2 and node[0] == "[" and node[-1] == "]":
+            return node
+        return None
+
+    def _generate_list(self, list_node: Any, unboxed: bool = False) -> str:
+        """
+        Generate list literal. With unboxed, a list of same-typed primitive
+        literals becomes a typed list (IntList, ...) rather than ListAny.
+        """
         items = []
+        # The AST node behind each generated item, for unboxing
+        nodes = []
+
+        def add(node: Any, item: str) -> None:
+            nodes.append(node)
+            items.append(item)
 
         def collect_items(node: Any) -> None:
             if node is None:
@@ -2502,14 +2812,14 @@ class AgoCodeGenerator:
                 if node not in (",", "[", "]"):
                     # Handle boolean and null literals
                     if node == "verum":
-                        items.append("AgoType::Bool(true)")
+                        add(node, "AgoType::Bool(true)")
                     elif node == "falsus":
-                        items.append("AgoType::Bool(false)")
+                        add(node, "AgoType::Bool(false)")
                     elif node == "inanis":
-                        items.append("AgoType::Null")
+                        add(node, "AgoType::Null")
                     else:
                         # Variable reference
-                        items.append(self._generate_variable_ref(node))
+                        add(node, self._generate_variable_ref(node))
                 return
             if isinstance(node, (list, tuple)):
                 for item in node:
@@ -2518,19 +2828,19 @@ class AgoCodeGenerator:
             d = to_dict(node)
             # Check if this is an actual value node
             if d.get("int") or d.get("float") or d.get("str") or d.get("roman"):
-                items.append(self._generate_expr(node))
+                add(node, self._generate_expr(node))
             elif d.get("id"):
-                items.append(self._generate_expr(node))
+                add(node, self._generate_expr(node))
             elif d.get("value"):
-                items.append(self._generate_expr(node))
+                add(node, self._generate_expr(node))
             elif d.get("list"):
-                items.append(self._generate_expr(node))
+                add(node, self._generate_expr(node))
             elif d.get("op") and d.get("right"):
                 # Unary operation (e.g., -3)
-                items.append(self._generate_expr(node))
+                add(node, self._generate_expr(node))
             elif d.get("left") and d.get("op") and d.get("right"):
                 # Binary operation
-                items.append(self._generate_expr(node))
+                add(node, self._generate_expr(node))
 
         if hasattr(list_node, "__iter__") and not isinstance(list_node, str):
             for item in list_node:
@@ -2540,9 +2850,40 @@ class AgoCodeGenerator:
         if not items:
             return "AgoType::ListAny(vec![])"
 
+        if unboxed:
+            unboxed_items = [self._unboxed_item(node) for node in nodes]
+            variants = {item[0] for item in unboxed_items if item is not None}
+            if None not in unboxed_items and len(variants) == 1:
+                values = ", ".join(value for _, value in unboxed_items)
+                return f"AgoType::{variants.pop()}(vec![{values}])"
+
         items_str = ", ".join(items)
         return f"AgoType::ListAny(vec![{items_str}])"
 
+    def _unboxed_item(self, node: Any) -> Optional[tuple[str, str]]:
+        """
+        The typed list variant and bare Rust value for a list item that is a
+        primitive literal or folds to an int, or None for anything else.
+        """
+        folded = self._const_int(node)
+        if folded is not None:
+            return "IntList", str(folded)
+        while is_ast_node(node):
+            d = to_dict(node)
+            if d.get("float") is not None:
+                return "FloatList", str(d["float"])
+            if d.get("str") is not None:
+                return "StringList", f"{d['str']}.to_string()"
+            if d.get("value") is not None:
+                node = d["value"]
+            elif d.get("base") is not None and not d.get("ops"):
+                node = d["base"]
+            else:
+                return None
+        if node in ("verum", "falsus"):
+            return "BoolList", "true" if node == "verum" else "false"
+        return None
+
     def _generate_struct(self, struct_node: Any) -> str:
         """Generate struct/map literal."""
         # Parse key-value pairs
@@ -2573,7 +2914,7 @@ class AgoCodeGenerator:
                     elif isinstance(item, (list, tuple)):
                         extract_pairs(item)
                     i += 1
-            elif hasattr(content, "parseinfo") or isinstance(content, dict):
+            elif is_ast_node(content):
                 d = to_dict(content)
                 for key, val in d.items():
                     if key not in ("parseinfo",) and val is not None:
@@ -2612,7 +2953,7 @@ class AgoCodeGenerator:
                 for item in node:
                     visit(item)
                 return
-            if isinstance(node, dict) or hasattr(node, "parseinfo"):
+            if is_ast_node(node):
                 d = to_dict(node)
                 # Check for identifier references
                 if "id" in d and isinstance(d["id"], str):
@@ -10,15 +10,16 @@ This module implements a Tatsu semantic actions class that validates:
 """
 
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterator, Optional
 
 from src.AgoSymbolTable import Symbol, SymbolTable, SymbolTableError
 
 # --- Type System Constants ---
 
-NUMERIC_TYPES = {"int", "float"}
-LIST_TYPES = {"int_list", "float_list", "bool_list", "string_list", "list_any"}
-PRIMITIVE_TYPES = {"int", "float", "bool", "string"}
+NUMERIC_TYPES = frozenset({"int", "float"})
+LIST_TYPES = frozenset({"int_list", "float_list", "bool_list", "string_list", "list_any"})
+PRIMITIVE_TYPES = frozenset({"int", "float", "bool", "string"})
 ALL_TYPES = (
     PRIMITIVE_TYPES
     | LIST_TYPES
@@ -45,11 +46,27 @@ ENDING_TO_TYPE = {
 # Sorted by length descending for proper matching
 ENDINGS_BY_LENGTH = sorted(ENDING_TO_TYPE.keys(), key=len, reverse=True)
 
+# Endings stored back to front, so a name's ending is found by walking its
+# last few characters once instead of testing every ending with endswith()
+_ENDING_KEY = "$"
+ENDING_TRIE: dict = {}
+for _ending in ENDING_TO_TYPE:
+    _node = ENDING_TRIE
+    for _ch in reversed(_ending):
+        _node = _node.setdefault(_ch, {})
+    _node[_ENDING_KEY] = _ending
+del _ending, _node, _ch
+
+# Native stdlib functions that replaced prelude definitions; a program may
+# still define its own, and stem-cast calls such as sumes() resolve to these.
+# The code generator imports this list, so both passes agree on it.
+PRELUDE_NATIVES = ("sumium", "prodium", "maxium", "minium", "spoliares")
+
 
 # --- Error Handling ---
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SemanticError:
     """Represents a semantic error found during analysis."""
 
@@ -67,26 +84,60 @@ class SemanticError:
         return f"{location}{self.message}"
 
 
+# --- Error Messages ---
+
+MSG_RETURN_OUTSIDE_FUNCTION = "'redeo' (return) outside of function"
+MSG_BREAK_OUTSIDE_LOOP = "'frio' (break) outside of loop"
+MSG_CONTINUE_OUTSIDE_LOOP = "'pergo' (continue) outside of loop"
+
+
+@lru_cache(maxsize=1024)
+def undeclared_identifier_message(name: str) -> str:
+    """Build (and reuse) the error message for an undeclared identifier."""
+    return f"Use of undeclared identifier '{name}'"
+
+
 # --- Helper Functions ---
 
 
+def is_ast_node(node: Any) -> bool:
+    """Check if a value is an AST node (Tatsu AST nodes are dict subclasses)."""
+    return isinstance(node, dict) or getattr(node, "parseinfo", None) is not None
+
+
 def get_node_location(node: Any) -> tuple[Optional[int], Optional[int]]:
     """Extract line and column from a Tatsu AST node if available."""
-    if hasattr(node, "parseinfo") and node.parseinfo:
-        info = node.parseinfo
+    info = getattr(node, "parseinfo", None)
+    if info:
         return (getattr(info, "line", None), getattr(info, "col", None))
     return (None, None)
 
 
+def find_ending(name: str, min_stem: int = 0) -> Optional[str]:
+    """
+    Find the longest type ending of a name that leaves at least min_stem
+    characters in front of it. Returns None if no ending matches.
+    """
+    node = ENDING_TRIE
+    ending = None
+    for i in range(len(name) - 1, min_stem - 1, -1):
+        node = node.get(name[i])
+        if node is None:
+            break
+        ending = node.get(_ENDING_KEY, ending)
+    return ending
+
+
+@lru_cache(maxsize=4096)
 def infer_type_from_name(name: str) -> Optional[str]:
     """
     Infer type from variable name suffix.
     Returns None if no valid suffix is found.
     """
-    for ending in ENDINGS_BY_LENGTH:
-        if name.endswith(ending):
-            return ENDING_TO_TYPE[ending]
-    return None
+    ending = find_ending(name)
+    if ending is None:
+        return None
+    return ENDING_TO_TYPE[ending]
 
 
 def get_element_type(list_type: str) -> str:
@@ -100,15 +151,16 @@ def get_element_type(list_type: str) -> str:
     return "unknown"
 
 
+@lru_cache(maxsize=4096)
 def get_stem(name: str) -> Optional[str]:
     """Extract the stem from a variable name by removing the type suffix."""
-    for ending in ENDINGS_BY_LENGTH:
-        if name.endswith(ending) and len(name) > len(ending):
-            return name[: -len(ending)]
-    return None
+    ending = find_ending(name, 1)
+    if ending is None:
+        return None
+    return name[: -len(ending)]
 
 
-def is_type_compatible(from_type: str, to_type: str) -> bool:
+def _compatible_rule(from_type: str, to_type: str) -> bool:
     """
     Check if from_type can be used where to_type is expected.
     Ago has strict typing - users can easily cast by changing variable name endings.
@@ -134,7 +186,7 @@ def is_type_compatible(from_type: str, to_type: str) -> bool:
     return False
 
 
-def can_cast(from_type: str, to_type: str) -> bool:
+def _cast_rule(from_type: str, to_type: str) -> bool:
     """
     Check if explicit cast via variable name ending is allowed.
     This is more permissive than is_type_compatible since the user
@@ -184,10 +236,39 @@ def can_cast(from_type: str, to_type: str) -> bool:
     if from_type in LIST_TYPES and to_type in LIST_TYPES:
         from_elem = get_element_type(from_type)
         to_elem = get_element_type(to_type)
-        return can_cast(from_elem, to_elem)
+        return _cast_rule(from_elem, to_elem)
     return False
 
 
+def _build_type_table(rule) -> dict[str, frozenset[str]]:
+    """Evaluate a type rule for every pair of known types."""
+    return {
+        from_type: frozenset(t for t in ALL_TYPES if rule(from_type, t))
+        for from_type in ALL_TYPES
+    }
+
+
+# Allowed target types for each known source type, decided once at import
+COMPATIBLE_TYPES = _build_type_table(_compatible_rule)
+CASTABLE_TYPES = _build_type_table(_cast_rule)
+
+
+def is_type_compatible(from_type: str, to_type: str) -> bool:
+    """Check if from_type can be used where to_type is expected."""
+    targets = COMPATIBLE_TYPES.get(from_type)
+    if targets is not None and to_type in ALL_TYPES:
+        return to_type in targets
+    return _compatible_rule(from_type, to_type)
+
+
+def can_cast(from_type: str, to_type: str) -> bool:
+    """Check if explicit cast via variable name ending is allowed."""
+    targets = CASTABLE_TYPES.get(from_type)
+    if targets is not None and to_type in ALL_TYPES:
+        return to_type in targets
+    return _cast_rule(from_type, to_type)
+
+
 def result_type_for_arithmetic(left: str, right: str) -> str:
     """Determine the result type for arithmetic operations."""
 
@@ -207,12 +288,58 @@ def to_dict(node: Any) -> dict:
     return {}
 
 
+def iter_expression_list(node: Any) -> Iterator[Any]:
+    """Yield the expressions of an expression_list node (first, then rest)."""
+    d = to_dict(node)
+    first = d.get("first")
+    if first:
+        yield first
+    rest = d.get("rest")
+    if rest:
+        for item in rest:
+            if isinstance(item, list):
+                if len(item) >= 2:
+                    yield item[1]
+            else:
+                item_d = to_dict(item)
+                if "expr" in item_d:
+                    yield item_d["expr"]
+
+
+def iter_block_statements(block: Any) -> Iterator[Any]:
+    """Yield the statements of a block or lambda block, skipping newlines."""
+    stmts = to_dict(block).get("stmts")
+    if stmts is None:
+        return
+    stmts_d = to_dict(stmts)
+    first = stmts_d.get("first")
+    if first:
+        yield first
+    rest = stmts_d.get("rest")
+    if rest:
+        for item in rest:
+            if isinstance(item, list):
+                for sub in item:
+                    if (
+                        sub
+                        and sub != "\n"
+                        and not (isinstance(sub, str) and sub.strip() == "")
+                    ):
+                        yield sub
+            elif item and item != "\n":
+                yield item
+
+
 # --- Semantic Checker Class ---
 
 
 class AgoSemanticChecker:
     """
     Tatsu semantic actions class for Ago language.
+
+    Only principio has an action; all checking happens there in a single pass
+    over the finished AST. Tatsu returns the AST unchanged for rules without a
+    matching method, so no per-rule pass-through stubs are needed.
     """
 
     def __init__(self):
@@ -224,6 +351,8 @@ class AgoSemanticChecker:
         self.current_lambda: Optional[Symbol] = None
         # Track if current function has a return statement
         self.function_has_return: bool = False
+        # Native stdlib functions a program may still define for itself
+        self.overridable_stdlib: set[str] = set(PRELUDE_NATIVES)
         # Register stdlib functions
         self._register_stdlib()
 
@@ -253,6 +382,13 @@ class AgoSemanticChecker:
             ("set", "null", ["Any", "Any", "Any"]),
             ("inseri", "null", ["Any", "Any", "Any"]),
             ("removium", "Any", ["Any", "Any"]),
+            # List reductions
+            ("sumium", "Any", ["list_any"]),
+            ("prodium", "Any", ["list_any"]),
+            ("maxium", "Any", ["list_any"]),
+            ("minium", "Any", ["list_any"]),
+            # String operations
+            ("spoliares", "string", ["string"]),  # strips surrounding whitespace
             # Iteration
             ("into_iter", "list_any", ["Any"]),
         ]
@@ -310,7 +446,7 @@ class AgoSemanticChecker:
         """Look up a symbol, reporting error if not found."""
         sym = self.sym_table.get_symbol(name)
         if sym is None:
-            self.report_error(f"Use of undeclared identifier '{name}'", node)
+            self.report_error(undeclared_identifier_message(name), node)
         return sym
 
     def declare_symbol(self, symbol: Symbol, node: Any = None) -> bool:
@@ -343,7 +479,7 @@ class AgoSemanticChecker:
             return "unknown"
 
         # AST nodes
-        if hasattr(expr, "parseinfo") or isinstance(expr, dict):
+        if is_ast_node(expr):
             return self._infer_node_type(expr)
 
         # Lists and tuples
@@ -377,7 +513,7 @@ class AgoSemanticChecker:
                     return "bool"
                 if inner == "inanis":
                     return "null"
-            if isinstance(inner, dict) or hasattr(inner, "parseinfo"):
+            if is_ast_node(inner):
                 return self._infer_node_type(inner)
 
         # Literals
@@ -420,13 +556,9 @@ class AgoSemanticChecker:
             # On-the-fly casting based on stem name
             # e.g., if 'xa' (int) is declared, 'xes' is a valid expression of type string.
             req_stem = None
-            req_suffix_ending = None
-            for ending in ENDINGS_BY_LENGTH:
-                if name.endswith(ending):
-                    if len(name) > len(ending):
-                        req_stem = name[: -len(ending)]
-                        req_suffix_ending = ending
-                        break
+            req_suffix_ending = find_ending(name, 1)
+            if req_suffix_ending is not None:
+                req_stem = name[: -len(req_suffix_ending)]
 
             if req_stem is not None:
                 visible_symbols = self.sym_table.get_all_visible_symbols()
@@ -650,7 +782,7 @@ class AgoSemanticChecker:
                     # Nested content - recurse
                     self._validate_mapstruct_content(item, parent_node)
                 i += 1
-        elif hasattr(content, "parseinfo") or isinstance(content, dict):
+        elif is_ast_node(content):
             d = to_dict(content)
             for k, v in d.items():
                 if k not in ("parseinfo",) and isinstance(v, (list, tuple)):
@@ -673,11 +805,7 @@ class AgoSemanticChecker:
         stem = get_stem(func_name)
         if stem:
             # Get the ending of the call name to determine cast type
-            call_ending = None
-            for ending in ENDINGS_BY_LENGTH:
-                if func_name.endswith(ending) and len(func_name) > len(ending):
-                    call_ending = ending
-                    break
+            call_ending = find_ending(func_name, 1)
 
             # Look for functions with the same stem
             visible = self.sym_table.get_all_visible_symbols()
@@ -782,7 +910,7 @@ class AgoSemanticChecker:
                     # Find the call dict in the list
                     for item in meth_info:
                         if item != "." and item is not None:
-                            if isinstance(item, dict) or hasattr(item, "parseinfo"):
+                            if is_ast_node(item):
                                 call_d = to_dict(item)
                                 break
                 else:
@@ -805,19 +933,21 @@ class AgoSemanticChecker:
                     if sym and sym.category == "func" and sym.return_type:
                         current_type = sym.return_type
                     else:
-                        # Check for stem-based function resolution
-                        for ending in ENDINGS_BY_LENGTH:
-                            if func_name_str.endswith(ending):
-                                stem = func_name_str[:-len(ending)]
-                                for visible_name, visible_sym in self.sym_table.get_all_visible_symbols().items():
-                                    if visible_sym.category == "func":
-                                        for e in ENDINGS_BY_LENGTH:
-                                            if visible_name.endswith(e) and visible_name[:-len(e)] == stem:
-                                                current_type = ENDING_TO_TYPE.get(ending, "Any")
-                                                break
-                                break
-                        else:
+                        # Check for stem-based function resolution: a function
+                        # matches if its name is the stem plus any type ending
+                        ending = find_ending(func_name_str)
+                        if ending is None:
                             current_type = "Any"
+                        else:
+                            stem = func_name_str[: -len(ending)]
+                            for visible_name, visible_sym in self.sym_table.get_all_visible_symbols().items():
+                                if (
+                                    visible_sym.category == "func"
+                                    and visible_name.startswith(stem)
+                                    and visible_name[len(stem) :] in ENDING_TO_TYPE
+                                ):
+                                    current_type = ENDING_TO_TYPE[ending]
+                                    break
             
             # Handle field access: field:(PERIOD name:identifier) or strfield:(PERIOD name:STR_LIT)
             # Grammar creates both 'name' and 'field'/'strfield' keys at the same level
@@ -886,7 +1016,7 @@ class AgoSemanticChecker:
                     # List format: ['.', method_node]
                     for sub in item:
                         if sub != "." and sub is not None:
-                            if isinstance(sub, dict) or hasattr(sub, "parseinfo"):
+                            if is_ast_node(sub):
                                 method = sub
                                 break
                 else:
@@ -930,14 +1060,8 @@ class AgoSemanticChecker:
                                 current_type = ENDING_TO_TYPE[func_name_str]
                             else:
                                 # Check if it's a stem+suffix that matches a function
-                                suffix, stem = None, None
-                                for ending in ENDINGS_BY_LENGTH:
-                                    if func_name_str.endswith(ending) and len(
-                                        func_name_str
-                                    ) > len(ending):
-                                        suffix = ending
-                                        stem = func_name_str[: -len(ending)]
-                                        break
+                                suffix = find_ending(func_name_str, 1)
+                                stem = get_stem(func_name_str)
 
                                 if stem and suffix:
                                     # Look for a function with matching stem
@@ -945,14 +1069,7 @@ class AgoSemanticChecker:
                                     for scope in self.sym_table.scopes.values():
                                         for name, s in scope.items():
                                             if s.category == "func":
-                                                func_stem = None
-                                                for e in ENDINGS_BY_LENGTH:
-                                                    if name.endswith(e) and len(
-                                                        name
-                                                    ) > len(e):
-                                                        func_stem = name[: -len(e)]
-                                                        break
-                                                if func_stem == stem:
+                                                if get_stem(name) == stem:
                                                     found_func = s
                                                     break
                                         if found_func:
@@ -1019,23 +1136,8 @@ class AgoSemanticChecker:
         if "call" in d and d.get("call") is not None:
             d = to_dict(d["call"])
         
-        args = []
         args_node = d.get("args")
-
-        if args_node:
-            args_d = to_dict(args_node)
-            first = args_d.get("first")
-            if first:
-                args.append(first)
-            rest = args_d.get("rest")
-            if rest:
-                for item in rest:
-                    if isinstance(item, list) and len(item) >= 2:
-                        args.append(item[1])
-                    else:
-                        item_d = to_dict(item)
-                        if "expr" in item_d:
-                            args.append(item_d["expr"])
+        args = list(iter_expression_list(args_node)) if args_node else []
 
         # In method chaining, receiver is implicitly the first argument
         # So actual_count = len(args) + 1 (for receiver)
@@ -1143,7 +1245,7 @@ class AgoSemanticChecker:
         if isinstance(mapstruct_node, (list, tuple)):
             for item in mapstruct_node:
                 if item is not None and item not in ("{", "}", "\n", "\r\n"):
-                    if hasattr(item, "parseinfo") or isinstance(item, dict):
+                    if is_ast_node(item):
                         content = item
                         break
                     elif isinstance(item, list):
@@ -1184,7 +1286,7 @@ class AgoSemanticChecker:
                     # Identifier key
                     key = item
                     i += 1
-                elif hasattr(item, "parseinfo") or isinstance(item, dict):
+                elif is_ast_node(item):
                     if key is not None and value is None:
                         value = item
                     else:
@@ -1208,7 +1310,7 @@ class AgoSemanticChecker:
             if rest is not None:
                 self._validate_mapcontent(rest, parent_node)
 
-        elif hasattr(content, "parseinfo") or isinstance(content, dict):
+        elif is_ast_node(content):
             d = to_dict(content)
             # Look for key-value patterns in the dict
             for k, v in d.items():
@@ -1251,7 +1353,7 @@ class AgoSemanticChecker:
                 continue
             if isinstance(item, (list, tuple)):
                 self._validate_struct_content_list(item, parent_node)
-            elif hasattr(item, "parseinfo") or isinstance(item, dict):
+            elif is_ast_node(item):
                 self._validate_mapcontent(item, parent_node)
 
     def _validate_struct_content_list(self, content: Any, parent_node: Any) -> None:
@@ -1633,6 +1735,11 @@ class AgoSemanticChecker:
             num_of_params=len(param_symbols),
         )
 
+        # A user definition replaces the native function of that name
+        if func_name in self.overridable_stdlib:
+            self.overridable_stdlib.discard(func_name)
+            self.sym_table.remove_symbol_from_current_scope(func_name)
+
         self.declare_symbol(func_symbol, ast)
 
         # Enter function context
@@ -1676,7 +1783,7 @@ class AgoSemanticChecker:
         # Unwrap 'value' wrapper if present (can be nested)
         while "value" in d and d.get("value") is not None:
             inner = d["value"]
-            if isinstance(inner, dict) or hasattr(inner, "parseinfo"):
+            if is_ast_node(inner):
                 d = to_dict(inner)
             else:
                 break
@@ -1684,7 +1791,7 @@ class AgoSemanticChecker:
         # Check for new structure: lambda is in 'base'
         if "base" in d and d.get("base") is not None:
             base = d["base"]
-            if isinstance(base, dict) or hasattr(base, "parseinfo"):
+            if is_ast_node(base):
                 base_d = to_dict(base)
                 if "body" in base_d:
                     d = base_d
@@ -1731,29 +1838,8 @@ class AgoSemanticChecker:
         if block is None:
             return
 
-        d = to_dict(block)
-        stmts = d.get("stmts")
-        if stmts is None:
-            return
-
-        stmts_d = to_dict(stmts)
-        first = stmts_d.get("first")
-        if first:
-            self._process_lambda_statement(first)
-
-        rest = stmts_d.get("rest")
-        if rest:
-            for item in rest:
-                if isinstance(item, list):
-                    for sub in item:
-                        if (
-                            sub
-                            and sub != "\n"
-                            and not (isinstance(sub, str) and sub.strip() == "")
-                        ):
-                            self._process_lambda_statement(sub)
-                elif item and item != "\n":
-                    self._process_lambda_statement(item)
+        for stmt in iter_block_statements(block):
+            self._process_lambda_statement(stmt)
 
     def _process_lambda_statement(self, stmt):
         """Process a lambda statement, which may include implicit_return."""
@@ -1780,7 +1866,7 @@ class AgoSemanticChecker:
         # Unwrap 'value' wrapper if present (can be nested)
         while "value" in d and d.get("value") is not None:
             inner = d["value"]
-            if isinstance(inner, dict) or hasattr(inner, "parseinfo"):
+            if is_ast_node(inner):
                 d = to_dict(inner)
             else:
                 break
@@ -1788,7 +1874,7 @@ class AgoSemanticChecker:
         # Check for new structure: base contains the lambda
         if "base" in d and d.get("base") is not None:
             base = d["base"]
-            if isinstance(base, dict) or hasattr(base, "parseinfo"):
+            if is_ast_node(base):
                 base_d = to_dict(base)
                 if "body" in base_d and "name" not in base_d:
                     return True
@@ -1801,7 +1887,6 @@ class AgoSemanticChecker:
         if params_node is None:
             return []
 
-        d = to_dict(params_node)
         symbols = []
 
         def make_param_symbol(name: str) -> Symbol:
@@ -1812,23 +1897,11 @@ class AgoSemanticChecker:
                 return Symbol(name=name, type_t=type_t, category="var", num_of_params=-1)
             return Symbol(name=name, type_t=type_t)
 
-        first = d.get("first")
-        if first:
-            name = self._extract_identifier(first)
-            if name:
-                symbols.append(make_param_symbol(name))
-
-        rest = d.get("rest")
-        if rest:
-            for item in rest:
-                item_d = to_dict(item) if not isinstance(item, list) else {}
-                expr = item_d.get("expr") if item_d else None
-                if expr is None and isinstance(item, list) and len(item) >= 2:
-                    expr = item[1]
-                if expr:
-                    name = self._extract_identifier(expr)
-                    if name:
-                        symbols.append(make_param_symbol(name))
+        for expr in iter_expression_list(params_node):
+            if expr:
+                name = self._extract_identifier(expr)
+                if name:
+                    symbols.append(make_param_symbol(name))
 
         return symbols
 
@@ -1842,12 +1915,12 @@ class AgoSemanticChecker:
         # Check value wrapper
         if "value" in d:
             inner = d["value"]
-            if isinstance(inner, dict) or hasattr(inner, "parseinfo"):
+            if is_ast_node(inner):
                 return self._extract_identifier(inner)
         # Check base wrapper (new postfix structure)
         if "base" in d:
             base = d["base"]
-            if isinstance(base, dict) or hasattr(base, "parseinfo"):
+            if is_ast_node(base):
                 return self._extract_identifier(base)
         return None
 
@@ -1856,29 +1929,8 @@ class AgoSemanticChecker:
         if block is None:
             return
 
-        d = to_dict(block)
-        stmts = d.get("stmts")
-        if stmts is None:
-            return
-
-        stmts_d = to_dict(stmts)
-        first = stmts_d.get("first")
-        if first:
-            self._process_statement(first)
-
-        rest = stmts_d.get("rest")
-        if rest:
-            for item in rest:
-                if isinstance(item, list):
-                    for sub in item:
-                        if (
-                            sub
-                            and sub != "\n"
-                            and not (isinstance(sub, str) and sub.strip() == "")
-                        ):
-                            self._process_statement(sub)
-                elif item and item != "\n":
-                    self._process_statement(item)
+        for stmt in iter_block_statements(block):
+            self._process_statement(stmt)
 
     def _handle_declaration(self, ast):
         """Handle variable declaration: name := value"""
@@ -1996,11 +2048,11 @@ class AgoSemanticChecker:
                             continue
                         if elif_cond is None and item is not None:
                             # First non-aluid item is the condition
-                            if isinstance(item, dict) or hasattr(item, "parseinfo"):
+                            if is_ast_node(item):
                                 elif_cond = item
                         elif elif_body is None and item is not None:
                             # Second non-aluid item is the body
-                            if isinstance(item, dict) or hasattr(item, "parseinfo"):
+                            if is_ast_node(item):
                                 elif_body = item
                 else:
                     # Handle dict structure
@@ -2142,7 +2194,7 @@ class AgoSemanticChecker:
                         )
                     else:
                         self.report_error(
-                            f"Use of undeclared identifier '{func_name}'", call_node
+                            undeclared_identifier_message(func_name), call_node
                         )
                 elif sym.category == "func":
                     # For method chains, recv becomes the first argument
@@ -2198,7 +2250,7 @@ class AgoSemanticChecker:
                         )
                     else:
                         self.report_error(
-                            f"Use of undeclared identifier '{func_name}'", parent_node
+                            undeclared_identifier_message(func_name), parent_node
                         )
                 elif sym.category == "func":
                     # Validate arguments
@@ -2244,7 +2296,7 @@ class AgoSemanticChecker:
                                 )
                             else:
                                 self.report_error(
-                                    f"Use of undeclared identifier '{method_name_str}'", parent_node
+                                    undeclared_identifier_message(method_name_str), parent_node
                                 )
 
     def _validate_call_chain(self, chain, current_type: str, parent_node: Any):
@@ -2261,7 +2313,7 @@ class AgoSemanticChecker:
             if isinstance(item, (list, tuple)):
                 for sub in item:
                     if sub != "." and sub is not None:
-                        if isinstance(sub, dict) or hasattr(sub, "parseinfo"):
+                        if is_ast_node(sub):
                             method = sub
                             break
             else:
@@ -2286,12 +2338,8 @@ class AgoSemanticChecker:
                     
                     if sym is None:
                         # Check if it's a stem-based function call
-                        suffix, stem = None, None
-                        for ending in ENDINGS_BY_LENGTH:
-                            if func_name_str.endswith(ending) and len(func_name_str) > len(ending):
-                                suffix = ending
-                                stem = func_name_str[:-len(ending)]
-                                break
+                        suffix = find_ending(func_name_str, 1)
+                        stem = get_stem(func_name_str)
                         
                         if stem and suffix:
                             # Look for a function with matching stem
@@ -2299,12 +2347,7 @@ class AgoSemanticChecker:
                             for scope in self.sym_table.scopes.values():
                                 for name, s in scope.items():
                                     if s.category == "func":
-                                        func_stem = None
-                                        for e in ENDINGS_BY_LENGTH:
-                                            if name.endswith(e) and len(name) > len(e):
-                                                func_stem = name[:-len(e)]
-                                                break
-                                        if func_stem == stem:
+                                        if get_stem(name) == stem:
                                             found_func = s
                                             break
                                 if found_func:
@@ -2321,7 +2364,7 @@ class AgoSemanticChecker:
                                 continue
                         
                         self.report_error(
-                            f"Use of undeclared identifier '{func_name_str}'", parent_node
+                            undeclared_identifier_message(func_name_str), parent_node
                         )
                     elif sym.category == "func" or sym.type_t == "function":
                         # Valid function call
@@ -2353,19 +2396,7 @@ class AgoSemanticChecker:
 
         args_node = d.get("args")
         if args_node:
-            args_d = to_dict(args_node)
-            first = args_d.get("first")
-            if first:
-                args.append(first)
-            rest = args_d.get("rest")
-            if rest:
-                for item in rest:
-                    if isinstance(item, list) and len(item) >= 2:
-                        args.append(item[1])
-                    else:
-                        item_d = to_dict(item)
-                        if "expr" in item_d:
-                            args.append(item_d["expr"])
+            args.extend(iter_expression_list(args_node))
 
         expected_count = func_sym.num_of_params
         actual_count = len(args)
@@ -2396,7 +2427,7 @@ class AgoSemanticChecker:
     def _handle_return(self, ast):
         """Handle return statement."""
         if self.current_function is None:
-            self.report_error("'redeo' (return) outside of function", ast)
+            self.report_error(MSG_RETURN_OUTSIDE_FUNCTION, ast)
             return
 
         # Mark that this function has a return statement
@@ -2419,144 +2450,9 @@ class AgoSemanticChecker:
     def _handle_break(self, ast):
         """Handle break statement."""
         if self.loop_depth <= 0:
-            self.report_error("'frio' (break) outside of loop", ast)
+            self.report_error(MSG_BREAK_OUTSIDE_LOOP, ast)
 
     def _handle_continue(self, ast):
         """Handle continue statement."""
         if self.loop_depth <= 0:
-            self.report_error("'pergo' (continue) outside of loop", ast)
-
-    # --- Tatsu Semantic Action Stubs ---
-    # These just return the AST unchanged; actual processing is done in principio
-
-    def sub_principio(self, ast):
-        return ast
-
-    def statement(self, ast):
-        return ast
-
-    def declaration_stmt(self, ast):
-        return ast
-
-    def reassignment_stmt(self, ast):
-        return ast
-
-    def method_decl(self, ast):
-        return ast
-
-    def lambda_decl(self, ast):
-        return ast
-
-    def if_stmt(self, ast):
-        return ast
-
-    def while_stmt(self, ast):
-        return ast
-
-    def for_stmt(self, ast):
-        return ast
-
-    def call_stmt(self, ast):
-        return ast
-
-    def nodotcall_stmt(self, ast):
-        return ast
-
-    def return_stmt(self, ast):
-        return ast
-
-    def else_fragment(self, ast):
-        return ast
-
-    def block(self, ast):
-        return ast
-
-    def statement_list(self, ast):
-        return ast
-
-    def expression_list(self, ast):
-        return ast
-
-    def expression(self, ast):
-        return ast
-
-    def pa(self, ast):
-        return ast
-
-    def pb(self, ast):
-        return ast
-
-    def pc(self, ast):
-        return ast
-
-    def pd(self, ast):
-        return ast
-
-    def pe(self, ast):
-        return ast
-
-    def pf(self, ast):
-        return ast
-
-    def pg(self, ast):
-        return ast
-
-    def ph(self, ast):
-        return ast
-
-    def item(self, ast):
-        return ast
-
-    def list(self, ast):
-        return ast
-
-    def mapstruct(self, ast):
-        return ast
-
-    def mapcontent(self, ast):
-        return ast
-
-    def indexing(self, ast):
-        return ast
-
-    def identifier(self, ast):
-        return ast
-
-    def INTLIT(self, ast):
-        return ast
-
-    def FLOATLIT(self, ast):
-        return ast
-
-    def STR_LIT(self, ast):
-        return ast
-
-    def ROMAN_NUMERAL(self, ast):
-        return ast
-
-    def TRUE(self, ast):
-        return ast
-
-    def FALSE(self, ast):
-        return ast
-
-    def NULL(self, ast):
-        return ast
-
-    def IT(self, ast):
-        return ast
-
-    def BREAK(self, ast):
-        return ast
-
-    def CONTINUE(self, ast):
-        return ast
-
-    def PASS(self, ast):
-        return ast
-
-    def nl(self, ast):
-        return ast
-
-    def CR(self, ast):
-        return ast
+            self.report_error(MSG_CONTINUE_OUTSIDE_LOOP, ast)
@@ -12,7 +12,7 @@ class SymbolTableError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """Represents a symbol (variable, function, parameter) in the symbol table."""
 
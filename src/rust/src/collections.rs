@@ -1,3 +1,5 @@
+use crate::iterators::into_iter;
+use crate::operators::{add, greater_than, less_than, multiply};
 use crate::types::{AgoRange, AgoType};
 
 /// Helper to compute slice bounds from a range
@@ -359,3 +361,76 @@ pub fn validate_list_type(list: &AgoType, expected_elem: &str) -> AgoType {
     }
     list.clone()
 }
+
+// --- Reductions ---
+//
+// Typed lists fold over their unboxed vectors; anything else goes through
+// the generic operators, so results match folding with the Ago operators.
+
+/// Left-folds an unboxed vector with `op`, wrapping the result with `wrap`.
+/// Returns Null when the vector is empty.
+fn reduce_vec<T: Copy>(v: &[T], op: impl Fn(T, T) -> T, wrap: fn(T) -> AgoType) -> AgoType {
+    v.iter().copied().reduce(op).map_or(AgoType::Null, wrap)
+}
+
+/// Left-folds the elements of an iterable with `op`, starting from the first
+/// element. Returns Null when there are no elements.
+fn fold_items(iterable: &AgoType, op: impl Fn(AgoType, AgoType) -> AgoType) -> AgoType {
+    let mut items = into_iter(iterable);
+    match items.next() {
+        Some(first) => items.fold(first, op),
+        None => AgoType::Null,
+    }
+}
+
+/// Sums the elements of a list. Returns Null for an empty list.
+/// Name ends in -ium (returns Any)
+pub fn sumium(list: &AgoType) -> AgoType {
+    match list {
+        AgoType::IntList(v) => reduce_vec(v, |a, b| a + b, AgoType::Int),
+        AgoType::FloatList(v) => reduce_vec(v, |a, b| a + b, AgoType::Float),
+        _ => fold_items(list, |a, b| add(&a, &b)),
+    }
+}
+
+/// Multiplies the elements of a list. Returns Null for an empty list.
+/// Name ends in -ium (returns Any)
+pub fn prodium(list: &AgoType) -> AgoType {
+    match list {
+        AgoType::IntList(v) => reduce_vec(v, |a, b| a * b, AgoType::Int),
+        AgoType::FloatList(v) => reduce_vec(v, |a, b| a * b, AgoType::Float),
+        _ => fold_items(list, |a, b| multiply(&a, &b)),
+    }
+}
+
+/// Returns the largest element of a list. Returns Null for an empty list.
+/// Name ends in -ium (returns Any)
+pub fn maxium(list: &AgoType) -> AgoType {
+    match list {
+        AgoType::IntList(v) => reduce_vec(v, |a, b| if a > b { a } else { b }, AgoType::Int),
+        AgoType::FloatList(v) => reduce_vec(v, |a, b| if a > b { a } else { b }, AgoType::Float),
+        _ => fold_items(list, |a, b| {
+            if matches!(greater_than(&a, &b), AgoType::Bool(true)) {
+                a
+            } else {
+                b
+            }
+        }),
+    }
+}
+
+/// Returns the smallest element of a list. Returns Null for an empty list.
+/// Name ends in -ium (returns Any)
+pub fn minium(list: &AgoType) -> AgoType {
+    match list {
+        AgoType::IntList(v) => reduce_vec(v, |a, b| if a < b { a } else { b }, AgoType::Int),
+        AgoType::FloatList(v) => reduce_vec(v, |a, b| if a < b { a } else { b }, AgoType::Float),
+        _ => fold_items(list, |a, b| {
+            if matches!(less_than(&a, &b), AgoType::Bool(true)) {
+                a
+            } else {
+                b
+            }
+        }),
+    }
+}
@@ -1,4 +1,4 @@
-use crate::types::{AgoInt, AgoType};
+use crate::types::{AgoInt, AgoType, TargetType};
 
 /// Prints a string to stdout. Returns Null.
 /// Name ends in -i (returns null/inanis)
@@ -90,3 +90,13 @@ pub fn exei(code: &AgoType) -> AgoType {
 pub fn aequalam(left: &AgoType, right: &AgoType) -> AgoType {
     AgoType::Bool(left == right)
 }
+
+/// Strips leading and trailing spaces, newlines and tabs from a string.
+/// Name ends in -es (returns string)
+pub fn spoliares(val: &AgoType) -> AgoType {
+    const WHITESPACE: [char; 3] = [' ', '\n', '\t'];
+    match val {
+        AgoType::String(s) => AgoType::String(s.trim_matches(&WHITESPACE[..]).to_string()),
+        other => spoliares(&other.as_type(TargetType::String)),
+    }
+}
@@ -35,3 +35,35 @@ pub fn into_iter(iterable: &AgoType) -> Box<dyn Iterator<Item = AgoType> + '_> {
         }
     }
 }
+
+/// Iterates the range between two Int bounds without building an `AgoRange`.
+///
+/// Used for `pro` loops over a range literal: unlike `into_iter`, the
+/// returned iterator is a concrete type, so the loop needs no virtual call
+/// per step and can be optimized like a plain Rust `for` over `a..=b`.
+#[inline]
+pub fn range_iter(
+    start: &AgoType,
+    end: &AgoType,
+    inclusive: bool,
+) -> impl Iterator<Item = AgoType> {
+    let (start, end) = match (start, end) {
+        (AgoType::Int(start), AgoType::Int(end)) => (*start, *end),
+        _ => panic!(
+            "Range operators can only be used with integers, but got {:?} and {:?}",
+            start, end
+        ),
+    };
+    // Exclusive ranges end one before `end`; an exclusive range ending at
+    // the minimum value is empty
+    let last = if inclusive {
+        Some(end)
+    } else {
+        end.checked_sub(1)
+    };
+    let range = match last {
+        Some(last) => start..=last,
+        None => 1..=0,
+    };
+    range.map(AgoType::Int)
+}
@@ -6,9 +6,11 @@ pub mod operators;
 pub mod types;
 
 // Re-export everything for easy importing
-pub use collections::{get, inseri, removium, set, validate_list_type};
-pub use functions::{aequalam, apertu, audies, dici, exei, species, scribi};
-pub use iterators::into_iter;
+pub use collections::{
+    get, inseri, maxium, minium, prodium, removium, set, sumium, validate_list_type,
+};
+pub use functions::{aequalam, apertu, audies, dici, exei, scribi, species, spoliares};
+pub use iterators::{into_iter, range_iter};
 pub use operators::{
     add, and, bitwise_and, bitwise_or, bitwise_xor, contains, divide, elvis, greater_equal,
     greater_than, less_equal, less_than, modulo, multiply, not, or, slice, sliceto, subtract,
@@ -1,4 +1,4 @@
-use ago_stdlib::iterators::into_iter;
+use ago_stdlib::iterators::{into_iter, range_iter};
 use ago_stdlib::types::{AgoRange, AgoType};
 
 #[test]
@@ -92,3 +92,21 @@ fn test_iter_non_iterable() {
     let mut iter = into_iter(&val);
     assert_eq!(iter.next(), None);
 }
+
+#[test]
+fn test_range_iter_inclusive() {
+    let items: Vec<AgoType> = range_iter(&AgoType::Int(1), &AgoType::Int(3), true).collect();
+    assert_eq!(items, vec![AgoType::Int(1), AgoType::Int(2), AgoType::Int(3)]);
+}
+
+#[test]
+fn test_range_iter_exclusive() {
+    let items: Vec<AgoType> = range_iter(&AgoType::Int(1), &AgoType::Int(3), false).collect();
+    assert_eq!(items, vec![AgoType::Int(1), AgoType::Int(2)]);
+}
+
+#[test]
+fn test_range_iter_empty() {
+    assert_eq!(range_iter(&AgoType::Int(3), &AgoType::Int(1), true).count(), 0);
+    assert_eq!(range_iter(&AgoType::Int(0), &AgoType::Int(i128::MIN), false).count(), 0);
+}
@@ -0,0 +1,15 @@
+"""Pytest hooks for the Ago test suite's on-disk caches."""
+import time
+
+# When this run started; cache entries used since then are never pruned
+_session_start = time.time()
+
+
+def pytest_sessionfinish(session):
+    """Prune the harness caches once per run, from the main process only."""
+    if hasattr(session.config, "workerinput"):
+        return
+
+    from harness import prune_cache
+
+    prune_cache(since=_session_start)
@@ -0,0 +1,421 @@
+"""
+Shared compile-and-run harness for the Ago code generation tests.
+
+Compiles Ago source to Rust, builds it against the Rust stdlib and runs the
+resulting binary. The stdlib is compiled once into an rlib and each program is
+then a single rustc call against it, with no cargo in the loop. Built binaries
+are cached on disk keyed by a hash of the generated Rust (and of the stdlib
+sources), so identical programs skip rustc entirely on later runs. Parsed
+ASTs and the Rust generated for each program are cached on disk the same
+way, so later runs skip the Python front end too. Entries that go unused are
+pruned at the end of each run (see prune_cache).
+"""
+
+import fcntl
+import hashlib
+import os
+import pickle
+import subprocess
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
+
+from src.AgoParser import AgoParser
+from src.AgoSemanticChecker import AgoSemanticChecker
+from src.AgoCodeGenerator import generate, get_suffix_and_stem, to_dict
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent.parent.resolve()
+STDLIB_DIR = SCRIPT_DIR / "src" / "rust"
+PRELUDE_FILE = SCRIPT_DIR / "stdlib" / "prelude.ago"
+PARSER_FILE = SCRIPT_DIR / "src" / "AgoParser.py"
+COMPILER_DIR = SCRIPT_DIR / "src"
+
+# Binaries built by previous runs, named by content hash
+CACHE_DIR = SCRIPT_DIR / ".pytest_cache" / "ago"
+BIN_CACHE_DIR = CACHE_DIR / "bin"
+
+# Prebuilt stdlib rlibs, named by the stdlib fingerprint
+LIB_DIR = CACHE_DIR / "lib"
+
+# Pickled ASTs, named by a hash of the source and the parser
+AST_DIR = CACHE_DIR / "ast"
+
+# Generated Rust, named by a hash of the program and the compiler
+RUST_DIR = CACHE_DIR / "rust"
+
+# Every cache directory above; entries are pruned from these after each run
+CACHE_DIRS = (BIN_CACHE_DIR, LIB_DIR, AST_DIR, RUST_DIR)
+
+# Entries unused for this many days are pruned, then the least recently
+# used ones until the caches fit in this many megabytes. A full run keeps
+# about 165MB of stripped binaries, so the cap holds a few suites' worth.
+CACHE_MAX_DAYS = float(os.environ.get("AGO_TEST_CACHE_MAX_DAYS", "7"))
+CACHE_MAX_MB = float(os.environ.get("AGO_TEST_CACHE_MAX_MB", "512"))
+
+# Test programs are tiny and short-lived, so skip LLVM optimizations and
+# split codegen as finely as possible; compile time dominates every test.
+# Strip std's debug info as cargo does by default, or every cached binary
+# carries several megabytes of it.
+RUSTC_FLAGS = [
+    "--edition=2021",
+    "-C", "opt-level=0",
+    "-C", "codegen-units=256",
+    "-C", "strip=debuginfo",
+]
+
+# Optionally swap LLVM for a faster codegen backend such as cranelift; this
+# needs a nightly toolchain with the backend component installed
+if os.environ.get("AGO_CODEGEN_BACKEND"):
+    RUSTC_FLAGS.append(f"-Zcodegen-backend={os.environ['AGO_CODEGEN_BACKEND']}")
+
+# Honour a compiler cache such as sccache the same way cargo does
+RUSTC = ["rustc"]
+if os.environ.get("RUSTC_WRAPPER"):
+    RUSTC.insert(0, os.environ["RUSTC_WRAPPER"])
+
+# The generated parser holds no state between parses, so one instance serves
+# every test
+parser = AgoParser()
+
+# Prelude source, read once
+PRELUDE_SOURCE = PRELUDE_FILE.read_text() + "\n" if PRELUDE_FILE.exists() else ""
+
+# Generated Rust for each (source, include_prelude) compiled in this session
+_rust_cache: dict[tuple[str, bool], str] = {}
+
+
+@lru_cache(maxsize=1)
+def stdlib_fingerprint() -> str:
+    """Hash the stdlib crate sources, the rustc version and flags so cached
+    binaries go stale with them."""
+    h = hashlib.blake2b(digest_size=16)
+    # An rlib only links against the exact rustc that built it
+    version = subprocess.run([*RUSTC, "-vV"], capture_output=True, check=True)
+    h.update(version.stdout)
+    h.update(" ".join(RUSTC_FLAGS).encode())
+    for path in sorted((STDLIB_DIR / "src").rglob("*.rs")):
+        h.update(path.relative_to(STDLIB_DIR).as_posix().encode())
+        h.update(path.read_bytes())
+    h.update((STDLIB_DIR / "Cargo.toml").read_bytes())
+    return h.hexdigest()
+
+
+def cache_hit(path: Path) -> bool:
+    """
+    Check whether a cache entry exists, marking it as used if so.
+
+    Pruning goes by modification time, so bumping it on every hit keeps the
+    entries recent runs rely on; it is one syscall, like exists().
+    """
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def prune_cache(since: float) -> None:
+    """
+    Delete cache entries unused for CACHE_MAX_DAYS, then the least recently
+    used ones until the caches fit in CACHE_MAX_MB.
+
+    Content-addressed entries never go stale on their own: every compiler or
+    stdlib change gives each program a new key. Entries used at or after
+    `since` (the current run) are always kept.
+    """
+    entries = []
+    for directory in CACHE_DIRS:
+        if not directory.is_dir():
+            continue
+        for path in directory.iterdir():
+            if path.name == ".lock":
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    # Oldest first, so each deletion frees the least recently used entry
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    expired = time.time() - CACHE_MAX_DAYS * 86400
+    for mtime, size, path in entries:
+        if mtime >= since:
+            break
+        if mtime >= expired and total <= CACHE_MAX_MB * 2**20:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+@contextmanager
+def build_lock(directory: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a cache directory across test processes.
+
+    For one-off builds every xdist worker needs before its first test: one
+    worker builds while the rest wait and then reuse its result, instead
+    of all of them building the same thing at once.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+@lru_cache(maxsize=1)
+def compiler_fingerprint() -> str:
+    """Hash the compiler sources and the prelude so cached Rust goes stale
+    with them."""
+    h = hashlib.blake2b(digest_size=16)
+    for path in sorted(COMPILER_DIR.glob("*.py")):
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    h.update(PRELUDE_SOURCE.encode())
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def parser_fingerprint() -> str:
+    """Hash the generated parser so cached ASTs go stale with it."""
+    return hashlib.blake2b(PARSER_FILE.read_bytes(), digest_size=16).hexdigest()
+
+
+def parse_cached(source: str, rule_name: str = "principio") -> Any:
+    """
+    Parse Ago source from rule_name, reusing the AST pickled by an earlier run.
+
+    Parsing a program of a few hundred characters takes a large fraction of
+    a second, far longer than checking it, so ASTs are pickled to disk keyed
+    by the source, the rule and the parser and shared with other test
+    processes and later runs.
+    """
+    key = hashlib.blake2b(
+        f"{parser_fingerprint()}{rule_name}:{source}".encode(), digest_size=16
+    ).hexdigest()
+    cached_ast = AST_DIR / f"{key}.pickle"
+    if cache_hit(cached_ast):
+        return pickle.loads(cached_ast.read_bytes())
+
+    ast = parser.parse(source, rule_name=rule_name)
+    AST_DIR.mkdir(parents=True, exist_ok=True)
+    staged = AST_DIR / f".{cached_ast.name}.{os.getpid()}"
+    staged.write_bytes(pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(staged, cached_ast)
+    return ast
+
+
+@lru_cache(maxsize=1)
+def prelude_ast() -> tuple:
+    """
+    Parse the prelude once; its top-level items prefix every program.
+
+    Every test process needs it before its first test, so one parses it
+    while the rest wait and then load its pickle.
+    """
+    with build_lock(AST_DIR):
+        return parse_cached(PRELUDE_SOURCE)
+
+
+def _words(node: Any) -> Iterator[str]:
+    """Yield every string in an AST: identifiers, function names, keywords."""
+    if isinstance(node, str):
+        yield node
+    elif isinstance(node, (list, tuple)):
+        for item in node:
+            yield from _words(item)
+    elif node is not None:
+        for key, val in to_dict(node).items():
+            if key != "parseinfo":
+                yield from _words(val)
+
+
+def _top_level_items(ast: Any) -> Iterator[Any]:
+    """Flatten a program AST into its top-level items, dropping newlines."""
+    if isinstance(ast, (list, tuple)):
+        for item in ast:
+            yield from _top_level_items(item)
+    elif ast is not None and not isinstance(ast, str):
+        yield ast
+
+
+@lru_cache(maxsize=1)
+def prelude_graph() -> tuple[dict[str, Any], dict[str, set[str]]]:
+    """Split the prelude into its functions and what each one calls."""
+    functions = {str(to_dict(item)["name"]): item for item in _top_level_items(prelude_ast())}
+    calls = {name: _prelude_refs(_words(item), functions) for name, item in functions.items()}
+    return functions, calls
+
+
+def _prelude_refs(words: Iterator[str], functions: dict[str, Any]) -> set[str]:
+    """Prelude functions named by words, directly or through a stem cast
+    such as mines() for minium()."""
+    stems = {get_suffix_and_stem(name)[1]: name for name in functions}
+    refs = set()
+    for word in words:
+        if word in functions:
+            refs.add(word)
+        elif (stem := get_suffix_and_stem(word)[1]) in stems:
+            refs.add(stems[stem])
+    return refs
+
+
+def prelude_for(ast: Any) -> tuple:
+    """The prelude functions a program can reach, in prelude order.
+
+    Tests use a handful of prelude functions at most; checking and
+    generating the rest for every program is wasted work.
+    """
+    functions, calls = prelude_graph()
+    needed = set()
+    pending = _prelude_refs(_words(ast), functions)
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending |= calls[name]
+    return tuple(item for name, item in functions.items() if name in needed)
+
+
+def generate_rust(ago_source: str, include_prelude: bool = False) -> str:
+    """Parse, check and generate Rust for Ago source, memoized per source."""
+    key = (ago_source, include_prelude)
+    rust_code = _rust_cache.get(key)
+    if rust_code is not None:
+        return rust_code
+
+    # Earlier runs may already have compiled this program
+    digest = hashlib.blake2b(
+        f"{compiler_fingerprint()}{include_prelude:d}{ago_source}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    cached_rust = RUST_DIR / f"{digest}.rs"
+    if cache_hit(cached_rust):
+        rust_code = cached_rust.read_text()
+        _rust_cache[key] = rust_code
+        return rust_code
+
+    # Parse, splicing in the already-parsed prelude functions the program
+    # uses. The checker's only action is principio, so running it on the
+    # combined AST is the same as checking the concatenated source.
+    ast = parser.parse(ago_source + "\n")
+    if include_prelude and PRELUDE_SOURCE:
+        ast = (*prelude_for(ast), *ast)
+
+    semantics = AgoSemanticChecker()
+    semantics.principio(ast)
+
+    if semantics.errors:
+        raise ValueError(f"Semantic errors: {semantics.errors}")
+
+    # Generate Rust
+    rust_code = generate(ast)
+    _rust_cache[key] = rust_code
+
+    RUST_DIR.mkdir(parents=True, exist_ok=True)
+    staged = RUST_DIR / f".{cached_rust.name}.{os.getpid()}"
+    staged.write_text(rust_code)
+    os.replace(staged, cached_rust)
+    return rust_code
+
+
+def rustc(args: list[str], source: str | None = None) -> None:
+    """Run rustc, raising if compilation fails."""
+    # rustc's diagnostics are only read on failure, so keep them as bytes
+    result = subprocess.run(
+        [*RUSTC, *RUSTC_FLAGS, *args],
+        input=source.encode() if source is not None else None,
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace")
+        raise RuntimeError(f"Compilation failed:\n{stderr}")
+
+
+@lru_cache(maxsize=1)
+def stdlib_rlib() -> Path:
+    """Compile the stdlib crate once per stdlib version."""
+    rlib = LIB_DIR / f"libago_stdlib-{stdlib_fingerprint()}.rlib"
+    if cache_hit(rlib):
+        return rlib
+
+    with build_lock(LIB_DIR):
+        if cache_hit(rlib):
+            return rlib
+
+        staged = LIB_DIR / f".{rlib.name}.{os.getpid()}"
+        rustc(
+            [
+                "--crate-type=rlib",
+                "--crate-name=ago_stdlib",
+                str(STDLIB_DIR / "src" / "lib.rs"),
+                "-o",
+                str(staged),
+            ]
+        )
+        os.replace(staged, rlib)
+        return rlib
+
+
+def build_binary(rust_code: str) -> Path:
+    """Build Rust code into a binary, reusing a cached build when possible."""
+    key = hashlib.blake2b(
+        (stdlib_fingerprint() + rust_code).encode(), digest_size=16
+    ).hexdigest()
+    cached_bin = BIN_CACHE_DIR / key
+    if cache_hit(cached_bin):
+        return cached_bin
+
+    # Compile straight from stdin; publish atomically so concurrent test
+    # processes never see a partial file
+    BIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    staged = BIN_CACHE_DIR / f".{key}.{os.getpid()}"
+    rustc(
+        [
+            "--crate-type=bin",
+            "--crate-name=ago_program",
+            "--extern",
+            f"ago_stdlib={stdlib_rlib()}",
+            "-",
+            "-o",
+            str(staged),
+        ],
+        source=rust_code,
+    )
+    os.replace(staged, cached_bin)
+
+    return cached_bin
+
+
+def compile_and_run(ago_source: str, include_prelude: bool = False) -> str:
+    """Compile Ago source to Rust and run it, returning stdout."""
+    exe_path = build_binary(generate_rust(ago_source, include_prelude))
+
+    # Run, reading only stdout; stderr goes straight to pytest's capture, so
+    # a panic still shows up in the failure report without a second pipe
+    result = subprocess.run([str(exe_path)], stdout=subprocess.PIPE, text=True)
+
+    return result.stdout
+
+
+# Printed between snippets in a batch; no test program prints it
+BATCH_SEPARATOR = "<<ago-batch>>"
+
+
+def compile_and_run_batch(snippets: list[str], include_prelude: bool = False) -> list[str]:
+    """
+    Compile independent snippets into one program and run it once,
+    returning each snippet's stdout.
+
+    Snippets share a single top level, so they must not declare clashing
+    names; one-line expressions over literals are the intended use.
+    """
+    source = "".join(f'{snippet}\ndici("{BATCH_SEPARATOR}")\n' for snippet in snippets)
+    outputs = compile_and_run(source, include_prelude).split(f"{BATCH_SEPARATOR}\n")
+    if len(outputs) != len(snippets) + 1:
+        raise RuntimeError(f"Batch stopped early:\n{outputs[-1]}")
+    return outputs[:-1]
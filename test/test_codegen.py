@@ -3,78 +3,7 @@ Comprehensive test suite for Ago code generation.
 Tests compile Ago code to Rust and verify execution output.
 """
 
-import subprocess
-import tempfile
-import os
-from pathlib import Path
-
-from src.AgoParser import AgoParser
-from src.AgoSemanticChecker import AgoSemanticChecker
-from src.AgoCodeGenerator import generate
-
-# Paths
-SCRIPT_DIR = Path(__file__).parent.parent.resolve()
-STDLIB_DIR = SCRIPT_DIR / "src" / "rust"
-PRELUDE_FILE = SCRIPT_DIR / "stdlib" / "prelude.ago"
-
-
-def compile_and_run(ago_source: str, include_prelude: bool = False) -> str:
-    """Compile Ago source to Rust and run it, returning stdout.
-    
-    Uses a unique temp directory for each invocation to support parallel testing.
-    """
-    # Optionally prepend the prelude
-    if include_prelude and PRELUDE_FILE.exists():
-        prelude = PRELUDE_FILE.read_text() + "\n"
-        ago_source = prelude + ago_source
-
-    # Parse and check
-    parser = AgoParser()
-    semantics = AgoSemanticChecker()
-    ast = parser.parse(ago_source + "\n", semantics=semantics)
-
-    if semantics.errors:
-        raise ValueError(f"Semantic errors: {semantics.errors}")
-
-    # Generate Rust
-    rust_code = generate(ast)
-
-    # Use a unique temp directory for this test
-    with tempfile.TemporaryDirectory(prefix="ago_test_") as tmpdir:
-        output_dir = Path(tmpdir)
-        src_dir = output_dir / "src"
-        src_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Write main.rs
-        main_rs = src_dir / "main.rs"
-        main_rs.write_text(rust_code)
-        
-        # Write Cargo.toml pointing to the stdlib
-        cargo_toml = output_dir / "Cargo.toml"
-        cargo_toml.write_text(f'''[package]
-name = "ago_program"
-version = "0.1.0"
-edition = "2021"
-
-[dependencies]
-ago_stdlib = {{ path = "{STDLIB_DIR}" }}
-''')
-
-        # Compile
-        result = subprocess.run(
-            ["cargo", "build", "--release"],
-            cwd=output_dir,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"Compilation failed:\n{result.stderr}")
-
-        # Run
-        exe_path = output_dir / "target" / "release" / "ago_program"
-        result = subprocess.run([str(exe_path)], capture_output=True, text=True)
-
-        return result.stdout
+from harness import compile_and_run
 
 
 # =============================================================================
@@ -105,6 +34,14 @@ class TestLiterals:
         output = compile_and_run('dici("hello world")')
         assert output.strip() == "hello world"
 
+    def test_string_literal_with_braces(self):
+        output = compile_and_run('dici("{} {x}")\n"{}".dici()')
+        assert output.splitlines() == ["{} {x}", "{}"]
+
+    def test_string_literal_dici_as_value(self):
+        output = compile_and_run('xi := dici("a")\ndici(("b").dici().es())')
+        assert output.splitlines() == ["a", "b", "inanis"]
+
     def test_string_with_escape(self):
         output = compile_and_run('dici("line1\\nline2")')
         assert "line1" in output and "line2" in output
@@ -238,6 +175,14 @@ class TestArithmetic:
         output = compile_and_run("xa := (10 - 2) * 3 + 4 / 2\ndici(xes)")
         assert output.strip() == "26"
 
+    def test_constant_division_truncates_toward_zero(self):
+        output = compile_and_run("xa := -7 / 2\nya := -7 % 2\ndici(xes)\ndici(yes)")
+        assert output.splitlines() == ["-3", "-1"]
+
+    def test_constant_and_variable_arithmetic(self):
+        output = compile_and_run("xa := 4\nya := xa * (2 + 3) - 1\ndici(yes)")
+        assert output.strip() == "19"
+
 
 # =============================================================================
 # COMPARISON OPERATIONS
@@ -422,7 +367,7 @@ dum xa < 3 {
     xa = xa + 1
 }
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["0", "1", "2"]
 
     def test_while_countdown(self):
@@ -433,7 +378,7 @@ dum xa > 0 {
     xa = xa - 1
 }
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["3", "2", "1"]
 
     def test_for_range_inclusive(self):
@@ -442,7 +387,7 @@ pro ia in 1..3 {
     dici(ies)
 }
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["1", "2", "3"]
 
     def test_for_range_exclusive(self):
@@ -451,18 +396,77 @@ pro ia in 1.<4 {
     dici(ies)
 }
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["1", "2", "3"]
 
+    def test_for_range_variable_bounds(self):
+        output = compile_and_run("""
+na := 2
+ma := 4
+pro ia in (na.<ma) {
+    dici(ies)
+}
+pro ia in ma..na {
+    dici(ies)
+}
+""")
+        lines = output.splitlines()
+        assert lines == ["2", "3"]
+
     def test_for_list(self):
         output = compile_and_run("""
 pro ia in [10, 20, 30] {
     dici(ies)
 }
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["10", "20", "30"]
 
+    def test_for_string_list(self):
+        output = compile_and_run("""
+pro xes in ["a", "b", "c"] {
+    dici(xes)
+}
+""")
+        lines = output.splitlines()
+        assert lines == ["a", "b", "c"]
+
+    def test_for_float_list(self):
+        output = compile_and_run("""
+pro xae in [1.5, 2.5] {
+    dici(xes)
+}
+""")
+        lines = output.splitlines()
+        assert lines == ["1.5", "2.5"]
+
+    def test_for_bool_list(self):
+        output = compile_and_run("""
+pro xam in [verum, falsus] {
+    dici(xes)
+}
+""")
+        lines = output.splitlines()
+        assert lines == ["true", "false"]
+
+    def test_for_folded_int_list(self):
+        output = compile_and_run("""
+pro ia in [1 + 1, -3, III] {
+    dici(ies)
+}
+""")
+        lines = output.splitlines()
+        assert lines == ["2", "-3", "3"]
+
+    def test_for_mixed_list(self):
+        output = compile_and_run("""
+pro xuum in [1, "a"] {
+    dici(xuum.es())
+}
+""")
+        lines = output.splitlines()
+        assert lines == ["1", "a"]
+
 
 # =============================================================================
 # FUNCTIONS
@@ -536,6 +540,62 @@ dici(xes)
 """)
         assert output.strip() == "55"
 
+    def test_recursive_fibonacci_memoized(self):
+        # Exponential without the memo table
+        output = compile_and_run("""
+des fiba(na) {
+    si na <= 1 {
+        redeo na
+    }
+    redeo fiba(na - 1) + fiba(na - 2)
+}
+xa := fiba(90)
+dici(xes)
+""")
+        assert output.strip() == "2880067194370816120"
+
+    def test_recursive_two_argument_memoized(self):
+        output = compile_and_run("""
+des binoma(na, ka) {
+    si ka == 0 vel ka == na {
+        redeo 1
+    }
+    redeo binoma(na - 1, ka - 1) + binoma(na - 1, ka)
+}
+xa := binoma(60, 30)
+dici(xes)
+""")
+        assert output.strip() == "118264581564861424"
+
+    def test_recursive_bool_function_memoized(self):
+        output = compile_and_run("""
+des evenam(na) {
+    si na == 0 {
+        redeo verum
+    }
+    redeo non evenam(na - 1)
+}
+xam := evenam(7)
+dici(xes)
+yam := evenam(10)
+dici(yes)
+""")
+        assert output.splitlines() == ["false", "true"]
+
+    def test_recursive_function_with_side_effects_not_memoized(self):
+        output = compile_and_run("""
+des counta(na) {
+    dici("tick")
+    si na <= 0 {
+        redeo 0
+    }
+    redeo counta(na - 1)
+}
+counta(1)
+counta(1)
+""")
+        assert output.splitlines() == ["tick"] * 4
+
     def test_function_calling_function(self):
         output = compile_and_run("""
 des squarea(xa) {
@@ -654,7 +714,7 @@ des liquum(luum, xo) {
 (0..10).aem().liqes(des { id % 2 == 0 }).dici()
 """)
         # Should contain 0, 2, 4, 6, 8, 10 (even numbers from 0 to 10)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         expected = ["0", "2", "4", "6", "8", "10"]
         assert lines == expected
 
@@ -808,7 +868,7 @@ pro ia in 1..5 {
     dici(ies)
 }
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["1", "2", "3", "4", "5"]
 
     def test_exclusive_range(self):
@@ -817,7 +877,7 @@ pro ia in 0.<3 {
     dici(ies)
 }
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["0", "1", "2"]
 
 
@@ -882,7 +942,7 @@ dici("one")
 dici("two")
 dici("three")
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["one", "two", "three"]
 
     def test_nested_parentheses(self):
@@ -932,11 +992,10 @@ pro ia in 1..15 {
     }
 }
 """)
-        lines = output.strip().split("\n")
-        assert lines[0] == "1"
-        assert lines[2] == "Fizz"
-        assert lines[4] == "Buzz"
-        assert lines[14] == "FizzBuzz"
+        assert output == (
+            "1\n2\nFizz\n4\nBuzz\nFizz\n7\n8\nFizz\nBuzz\n"
+            "11\nFizz\n13\n14\nFizzBuzz\n"
+        )
 
     def test_sum_of_squares(self):
         output = compile_and_run("""
@@ -963,7 +1022,7 @@ des countdowni(na) {
 }
 countdowni(3)
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["3", "2", "1", "Blast off!"]
 
     def test_power_function(self):
@@ -1018,7 +1077,7 @@ dici(yes)
 zam := is_primeam(11)
 dici(zes)
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["true", "false", "true"]
 
     def test_list_iteration_sum(self):
@@ -1041,7 +1100,7 @@ pro ia in 1..3 {
     }
 }
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         expected = ["1", "2", "3", "2", "4", "6", "3", "6", "9"]
         assert lines == expected
 
@@ -1261,6 +1320,11 @@ class TestStdlibPrelude:
         output = compile_and_run('"\\t\\nhello\\n\\t".spoliares().dici()', include_prelude=True)
         assert output.strip() == "hello"
 
+    def test_spoliares_keeps_inner_whitespace(self):
+        """spoliares only trims the ends of the string."""
+        output = compile_and_run('dici("[" + " \\ta b\\t ".spoliares() + "]")')
+        assert output.splitlines() == ["[a b]"]
+
     def test_spoliares_no_whitespace(self):
         """spoliares handles string with no whitespace."""
         output = compile_and_run('"hello".spoliares().dici()', include_prelude=True)
@@ -1459,6 +1523,11 @@ si xa == inanis { dici("null") } aluid { dici("not null") }
         output = compile_and_run('[42].prodium().es().dici()', include_prelude=True)
         assert output.strip() == "42"
 
+    def test_reductions_over_float_list(self):
+        """Reductions fold float lists without the prelude."""
+        output = compile_and_run('xarum := [1.5, 2.0, 4.0]\nxarum.sumium().es().dici()\nxarum.prodium().es().dici()\nxarum.maxium().es().dici()')
+        assert output.splitlines() == ["7.5", "12", "4"]
+
     # ===== invena (find index) =====
     def test_invena_found(self):
         """invena returns index when element found."""
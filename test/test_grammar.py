@@ -348,8 +348,9 @@ def test_mapstruct_with_identifier_keys_and_trailing(parser):
     assert ast is not None
 
 
-def test_item_variants_literals_and_specials(parser):
-    exprs = [
+@pytest.mark.parametrize(
+    "expr",
+    [
         '"hello"',  # STR_LIT
         "3.14",  # FLOATLIT
         "42",  # INTLIT
@@ -359,10 +360,11 @@ def test_item_variants_literals_and_specials(parser):
         "id",  # IT
         "XII",  # ROMAN_NUMERAL
         "foo",  # identifier
-    ]
-    for e in exprs:
-        ast = parser.parse(e + "\n", rule_name="item")
-        assert ast is not None
+    ],
+)
+def test_item_variants_literals_and_specials(parser, expr):
+    ast = parser.parse(expr + "\n", rule_name="item")
+    assert ast is not None
 
 
 def test_item_paren_expression(parser):
@@ -2,79 +2,105 @@
 Tests for merge sort (genorduum) and range-to-list casting with indexing.
 """
 
-import subprocess
-import tempfile
-from pathlib import Path
+import pytest
 
-from src.AgoParser import AgoParser
-from src.AgoSemanticChecker import AgoSemanticChecker
-from src.AgoCodeGenerator import generate
+from harness import compile_and_run, compile_and_run_batch
 
-# Paths
-SCRIPT_DIR = Path(__file__).parent.parent.resolve()
-STDLIB_DIR = SCRIPT_DIR / "src" / "rust"
-PRELUDE_FILE = SCRIPT_DIR / "stdlib" / "prelude.ago"
 
+# =============================================================================
+# MERGE SORT (genorduum) TESTS
+# =============================================================================
 
-def compile_and_run(ago_source: str, include_prelude: bool = False) -> str:
-    """Compile Ago source to Rust and run it, returning stdout."""
-    # Optionally prepend the prelude
-    if include_prelude and PRELUDE_FILE.exists():
-        prelude = PRELUDE_FILE.read_text() + "\n"
-        ago_source = prelude + ago_source
-
-    # Parse and check
-    parser = AgoParser()
-    semantics = AgoSemanticChecker()
-    ast = parser.parse(ago_source + "\n", semantics=semantics)
-
-    if semantics.errors:
-        raise ValueError(f"Semantic errors: {semantics.errors}")
-
-    # Generate Rust
-    rust_code = generate(ast)
-
-    # Use a unique temp directory for this test
-    with tempfile.TemporaryDirectory(prefix="ago_test_") as tmpdir:
-        output_dir = Path(tmpdir)
-        src_dir = output_dir / "src"
-        src_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Write main.rs
-        main_rs = src_dir / "main.rs"
-        main_rs.write_text(rust_code)
-        
-        # Write Cargo.toml pointing to the stdlib
-        cargo_toml = output_dir / "Cargo.toml"
-        cargo_toml.write_text(f'''[package]
-name = "ago_program"
-version = "0.1.0"
-edition = "2021"
-
-[dependencies]
-ago_stdlib = {{ path = "{STDLIB_DIR}" }}
-''')
-
-        # Compile
-        result = subprocess.run(
-            ["cargo", "build", "--release"],
-            cwd=output_dir,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"Compilation failed:\n{result.stderr}")
 
-        # Run
-        exe_path = output_dir / "target" / "release" / "ago_program"
-        result = subprocess.run([str(exe_path)], capture_output=True, text=True)
+# Each case is one snippet, and all of them build into a single program
+SORT_CASES = {
+    # Sort a simple list in ascending order.
+    "ascending_basic": (
+        '[3, 1, 4, 1, 5, 9, 2, 6].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
+        "1,1,2,3,4,5,6,9",
+    ),
+    # Sort a simple list in descending order.
+    "descending_basic": (
+        '[3, 1, 4, 1, 5, 9, 2, 6].genorduum(des { 0 - id }).mutatuum(des {ides}).iunges(",").dici()',
+        "9,6,5,4,3,2,1,1",
+    ),
+    # Sort an already sorted list.
+    "already_sorted": (
+        '[1, 2, 3, 4, 5].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
+        "1,2,3,4,5",
+    ),
+    # Sort a reverse-sorted list.
+    "reverse_sorted": (
+        '[5, 4, 3, 2, 1].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
+        "1,2,3,4,5",
+    ),
+    # Sort a single element list.
+    "single_element": (
+        '[42].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
+        "42",
+    ),
+    # Sort an empty list.
+    "empty_list": (
+        '[].genorduum(des { id }).a().es().dici()',
+        "0",
+    ),
+    # Sort a two element list.
+    "two_elements": (
+        '[2, 1].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
+        "1,2",
+    ),
+    # Sort a list with negative numbers.
+    "negative_numbers": (
+        '[3, -1, 4, -1, 5, -9, 2, -6].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
+        "-9,-6,-1,-1,2,3,4,5",
+    ),
+    # Sort a list where all elements are the same.
+    "all_same": (
+        '[5, 5, 5, 5, 5].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
+        "5,5,5,5,5",
+    ),
+    # Sort a larger list to verify recursion works correctly.
+    "large_list": (
+        '[1,6,4,2,6,-9,-4,2,1,4,6,89,9,6,4,2,112,3456,78,7654,2,3,456].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
+        "-9,-4,1,1,2,2,2,2,3,4,4,4,6,6,6,6,9,78,89,112,456,3456,7654",
+    ),
+    # Sort a list containing zero.
+    "with_zero": (
+        '[3, 0, -2, 5, 0, -1].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
+        "-2,-1,0,0,3,5",
+    ),
+    # Verify sort preserves list length.
+    "preserves_length": (
+        '[9, 1, 8, 2, 7, 3, 6, 4, 5].genorduum(des { id }).a().es().dici()',
+        "9",
+    ),
+    # Sort then get minimum (should be first element).
+    "then_min": (
+        '[5, 3, 8, 1, 9].genorduum(des { id }).minium().es().dici()',
+        "1",
+    ),
+    # Sort then get maximum (should be last element).
+    "then_max": (
+        '[5, 3, 8, 1, 9].genorduum(des { id }).maxium().es().dici()',
+        "9",
+    ),
+}
 
-        return result.stdout
 
+@pytest.fixture(scope="module")
+def sort_outputs():
+    """
+    Run every sort case in one compiled program.
 
-# =============================================================================
-# MERGE SORT (genorduum) TESTS
-# =============================================================================
+    Returns None if the batch fails to compile or stops early, so each case
+    reruns on its own and a failure is reported against the case that broke.
+    """
+    snippets = [snippet for snippet, _ in SORT_CASES.values()]
+    try:
+        outputs = compile_and_run_batch(snippets, include_prelude=True)
+    except (RuntimeError, ValueError):
+        return None
+    return dict(zip(SORT_CASES, outputs))
 
 
 class TestMergeSort:
@@ -85,119 +111,15 @@ class TestMergeSort:
     For descending order, use `des { 0 - id }` (negate to reverse order).
     """
 
-    def test_sort_ascending_basic(self):
-        """Sort a simple list in ascending order."""
-        output = compile_and_run(
-            '[3, 1, 4, 1, 5, 9, 2, 6].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "1,1,2,3,4,5,6,9"
-
-    def test_sort_descending_basic(self):
-        """Sort a simple list in descending order."""
-        output = compile_and_run(
-            '[3, 1, 4, 1, 5, 9, 2, 6].genorduum(des { 0 - id }).mutatuum(des {ides}).iunges(",").dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "9,6,5,4,3,2,1,1"
-
-    def test_sort_already_sorted(self):
-        """Sort an already sorted list."""
-        output = compile_and_run(
-            '[1, 2, 3, 4, 5].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "1,2,3,4,5"
-
-    def test_sort_reverse_sorted(self):
-        """Sort a reverse-sorted list."""
-        output = compile_and_run(
-            '[5, 4, 3, 2, 1].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "1,2,3,4,5"
-
-    def test_sort_single_element(self):
-        """Sort a single element list."""
-        output = compile_and_run(
-            '[42].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "42"
-
-    def test_sort_empty_list(self):
-        """Sort an empty list."""
-        output = compile_and_run(
-            '[].genorduum(des { id }).a().es().dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "0"
-
-    def test_sort_two_elements(self):
-        """Sort a two element list."""
-        output = compile_and_run(
-            '[2, 1].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "1,2"
-
-    def test_sort_negative_numbers(self):
-        """Sort a list with negative numbers."""
-        output = compile_and_run(
-            '[3, -1, 4, -1, 5, -9, 2, -6].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "-9,-6,-1,-1,2,3,4,5"
-
-    def test_sort_all_same(self):
-        """Sort a list where all elements are the same."""
-        output = compile_and_run(
-            '[5, 5, 5, 5, 5].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "5,5,5,5,5"
-
-    def test_sort_large_list(self):
-        """Sort a larger list to verify recursion works correctly."""
-        output = compile_and_run(
-            '[1,6,4,2,6,-9,-4,2,1,4,6,89,9,6,4,2,112,3456,78,7654,2,3,456].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
-            include_prelude=True
-        )
-        expected = "-9,-4,1,1,2,2,2,2,3,4,4,4,6,6,6,6,9,78,89,112,456,3456,7654"
+    @pytest.mark.parametrize("case", SORT_CASES)
+    def test_sort(self, case, sort_outputs):
+        snippet, expected = SORT_CASES[case]
+        if sort_outputs is None:
+            output = compile_and_run(snippet, include_prelude=True)
+        else:
+            output = sort_outputs[case]
         assert output.strip() == expected
 
-    def test_sort_with_zero(self):
-        """Sort a list containing zero."""
-        output = compile_and_run(
-            '[3, 0, -2, 5, 0, -1].genorduum(des { id }).mutatuum(des {ides}).iunges(",").dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "-2,-1,0,0,3,5"
-
-    def test_sort_preserves_length(self):
-        """Verify sort preserves list length."""
-        output = compile_and_run(
-            '[9, 1, 8, 2, 7, 3, 6, 4, 5].genorduum(des { id }).a().es().dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "9"
-
-    def test_sort_then_min(self):
-        """Sort then get minimum (should be first element)."""
-        output = compile_and_run(
-            '[5, 3, 8, 1, 9].genorduum(des { id }).minium().es().dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "1"
-
-    def test_sort_then_max(self):
-        """Sort then get maximum (should be last element)."""
-        output = compile_and_run(
-            '[5, 3, 8, 1, 9].genorduum(des { id }).maxium().es().dici()',
-            include_prelude=True
-        )
-        assert output.strip() == "9"
-
 
 # =============================================================================
 # RANGE TO LIST CASTING WITH INDEXING TESTS
@@ -290,7 +212,7 @@ pro ia in laem {
     dici(ies)
 }
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["1", "2", "3"]
 
     def test_range_roman_numerals_various(self):
@@ -304,7 +226,7 @@ laem[IV].es().dici()
 # Last element (X=10)
 laem[IX].es().dici()
 """)
-        lines = output.strip().split("\n")
+        lines = output.splitlines()
         assert lines == ["1", "5", "10"]
 
     def test_range_to_list_filter(self):
@@ -1,10 +1,8 @@
 import pytest
 
-from src.AgoParser import AgoParser
 from src.AgoSemanticChecker import AgoSemanticChecker
 
-# Create a module-level parser instance
-parser = AgoParser()
+from harness import parse_cached
 
 # ---------- helpers ----------
 
@@ -14,7 +12,7 @@ def infer_type(expr_src: str, semantics=None):
     Parse a single expression and ask the semantic checker for its type.
     """
     semantics = AgoSemanticChecker() if not semantics else semantics
-    ast = parser.parse(expr_src + "\n", rule_name="expression", semantics=semantics)
+    ast = parse_cached(expr_src + "\n", rule_name="expression")
     t = semantics.infer_expr_type(ast)
     return t, semantics
 
@@ -25,7 +23,9 @@ def run_program(src: str):
     so we can inspect symbols, function types, and errors.
     """
     semantics = AgoSemanticChecker()
-    parser.parse(src, semantics=semantics)  # uses 'principio' by default
+    # ASTs come from the harness's on-disk cache; principio is the
+    # checker's only action, so run it over the cached tree directly
+    semantics.principio(parse_cached(src))
     return semantics
 
 
@@ -287,6 +287,26 @@ xa := add(2, 2)
     assert func_sym.return_type == "int"  # return type
 
 
+@pytest.mark.parametrize(
+    "expr, expected_type",
+    [
+        ("III.duples()", "string"),  # stem cast of dupla
+        ("III.duplae()", "float"),
+        ("III.dupla()", "int"),
+        ("III.nopees()", "int"),  # no function with that stem, type unchanged
+    ],
+)
+def test_method_call_with_stem_cast(expr, expected_type):
+    semantics = run_program("""\
+des dupla(na) {
+    redeo na * II
+}
+""")
+    t, _ = infer_type(expr, semantics)
+    assert t == expected_type
+    assert semantics.errors == []
+
+
 # Uncomment if you want to not handle on runtime ig
 # def test_function_call_with_wrong_argument_types():
 #     src = """\